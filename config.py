@@ -3,6 +3,11 @@ import os
 from pathlib import Path
 from typing import Any, Dict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from dotenv import load_dotenv
     load_dotenv()  # Load .env file if present
@@ -11,6 +16,9 @@ except ImportError:
 
 
 def load_json(path: Path) -> Dict[str, Any]:
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
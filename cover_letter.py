@@ -1,14 +1,15 @@
 import argparse
 import os
 import re
+from functools import cached_property, lru_cache
 from pathlib import Path
 from datetime import datetime
 
-from resume_utils import load_resume_data
+from resume_utils import load_resume_data, openai_client, squeeze_lines
 
 from docx import Document
 try:
-    from openai import OpenAI  # type: ignore
+    from openai import OpenAI  # type: ignore  # noqa: F401
     _OPENAI_AVAILABLE = True
 except Exception:
     _OPENAI_AVAILABLE = False
@@ -23,6 +24,19 @@ except Exception:
 _non_alnum = re.compile(r"[^a-z0-9+#.\-\s]")
 
 
+@lru_cache(maxsize=256)
+def _openai_letter(api_key: str, model: str, system: str, user: str) -> str:
+    """Chat completion memoized on the full prompt. Errors propagate and are
+    not cached, so only successful letters are reused."""
+    resp = openai_client(api_key).chat.completions.create(
+        model=model,
+        messages=[{"role": "system", "content": system}, {"role": "user", "content": user}],
+        temperature=0.6,
+        max_tokens=350,
+    )
+    return (resp.choices[0].message.content or "").strip()
+
+
 def _normalize_meta_field(value: str | None) -> str:
     if not value:
         return ""
@@ -53,8 +67,18 @@ class CoverLetterBuilder:
         self.resume_text = resume_text
         self.candidate_name = candidate_name or "Candidate"
 
+    # Resume-side tokens/lines are computed on first use and kept for later
+    # letters from the same builder; the OpenAI path never needs them.
+    @cached_property
+    def _resume_tokens(self) -> frozenset[str]:
+        return frozenset(_tokenize(self.resume_text))
+
+    @cached_property
+    def _resume_lines(self) -> list[str]:
+        return [ln.strip() for ln in (self.resume_text or "").splitlines() if ln.strip()]
+
     def extract_keywords(self, jd_text: str, max_terms: int = 24) -> list[str]:
-        tokens = set(_tokenize(self.resume_text) + _tokenize(jd_text))
+        tokens = self._resume_tokens.union(_tokenize(jd_text))
         ordered = [k for k in CORE_TERMS if k in tokens]
         if not ordered:
             ordered = list(tokens)
@@ -70,7 +94,7 @@ class CoverLetterBuilder:
         return out
 
     def compute_ats_score(self, jd_text: str) -> int:
-        rset = set(_tokenize(self.resume_text))
+        rset = self._resume_tokens
         jset = set(_tokenize(jd_text))
         if not jset:
             return 0
@@ -143,15 +167,14 @@ class CoverLetterBuilder:
         company = _normalize_meta_field(company)
         role = _normalize_meta_field(role)
         
-        rset = set(_tokenize(self.resume_text))
+        rset = self._resume_tokens
         jset = set(_tokenize(jd_text)) if jd_text else set()
         shared = [t for t in CORE_TERMS if t in rset and (not jset or t in jset)]
         shared = shared[:10] if shared else list(rset)[:10]
         keywords_str = ", ".join(shared)
 
-        resume_lines = [ln.strip() for ln in self.resume_text.splitlines() if ln.strip()]
         example_lines: list[str] = []
-        for ln in resume_lines:
+        for ln in self._resume_lines:
             if len(example_lines) >= 3:
                 break
             low = ln.lower()
@@ -197,7 +220,6 @@ class CoverLetterBuilder:
             key = api_key or os.getenv("OPENAI_API_KEY")
             if not key:
                 return None
-            client = OpenAI(api_key=key)
             system = (
                 "You are an expert technical recruiter and writing assistant. "
                 "Write a concise three-paragraph cover letter without greeting or signature. "
@@ -208,18 +230,14 @@ class CoverLetterBuilder:
             role_phrase = role if role else "this role"
             user = (
                 f"Company: {company_phrase}\nRole: {role_phrase}\n\n"
-                f"Job description:\n{jd_text}\n\n"
+                f"Job description:\n{squeeze_lines(jd_text)}\n\n"
                 f"Resume:\n{self.resume_text}\n\n"
                 "Rules:\n- Three short paragraphs\n- No greeting or signature\n- Reference concrete skills and outcomes "
                 "that align with the role\n- Avoid placeholders like 'Not specified'; use generic phrases instead\n"
             )
-            resp = client.chat.completions.create(
-                model=model,
-                messages=[{"role": "system", "content": system}, {"role": "user", "content": user}],
-                temperature=0.6,
-                max_tokens=350,
-            )
-            result = (resp.choices[0].message.content or "").strip()
+            # Identical JD/resume/model (e.g. a role reposted on several boards)
+            # reuses the earlier letter instead of another API call
+            result = _openai_letter(key, model, system, user)
             
             # Clean up any "Not specified" references that might have slipped through
             result = result.replace("Not specified.", "").replace("Not specified", "")
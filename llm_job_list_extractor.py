@@ -5,6 +5,7 @@ Extracts job URLs, titles, locations, and descriptions from HTML using LLM.
 import os
 import re
 import html
+import time
 from typing import Dict, List, Optional
 from urllib.parse import urljoin, urlparse
 
@@ -13,13 +14,91 @@ try:
 except Exception:
     openai_compat = None
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from dotenv import load_dotenv
+from pydantic import BaseModel, ValidationError
 
 load_dotenv()
 
+# Raw HTML beyond this size is mostly thrown away after cleaning, so the
+# tag and entity cleanup only scans a prefix of very large pages. Scripts and
+# styles are stripped from the whole page first, so the cut can't land inside
+# an unterminated <style> and leave raw CSS/JS behind.
+_CLEAN_INPUT_LIMIT = 200_000
+_CLEANED_HTML_LIMIT = 30000
+
+_SCRIPT_STYLE = re.compile(r'(?is)<(script|style).*?>.*?</\1>')
+_TAG = re.compile(r'<[^>]+>')
+_WS = re.compile(r'\s+')
+
+# Anchor open tags are matched on their own and the closing tag is located
+# with a plain forward search, avoiding a lazy DOTALL scan per link.
+_A_OPEN = re.compile(r'<a[^>]*href=["\']([^"\']+)["\'][^>]*>', re.IGNORECASE)
+_A_CLOSE = re.compile(r'</a>', re.IGNORECASE)
+
+# Re-prompt the LLM with the parse error this many times before giving up
+_MAX_PARSE_RETRIES = 2
+
+
+class JobItem(BaseModel):
+    """A single job as returned by the LLM (entries without a title/url are skipped later)."""
+    title: Optional[str] = ""
+    url: Optional[str] = ""
+    location: Optional[str] = ""
+    description: Optional[str] = ""
+
+JOB_LIST_PROMPT = """
+You are an expert at extracting job listings from career pages. Analyze the HTML content and links below to extract all job postings.
+
+**Company:** {company}
+**Base URL:** {base_url}
+
+**Available Links:**
+{links_text}
+
+**Page Content (first 30k chars):**
+{cleaned_html}
+
+**Instructions:**
+1. Identify all job postings on this page
+2. For each job, extract:
+   - Job title
+   - Job URL (must be a valid absolute URL)
+   - Location (if available)
+   - Brief description (if available, max 200 chars)
+
+3. Return results in this EXACT JSON format (array of objects):
+[
+  {{
+    "title": "Job Title",
+    "url": "https://full-url-to-job-posting",
+    "location": "City, State or Remote",
+    "description": "Brief job description"
+  }},
+  ...
+]
+
+**CRITICAL RULES:**
+- Only include jobs (not "Learn More", "About Us", etc.)
+- URLs MUST be absolute (start with http:// or https://)
+- URLs should point to individual job detail pages, not general pages
+- If URL is relative, make it absolute using base_url
+- Extract at most {max_jobs} jobs
+- If you can't find any jobs, return an empty array: []
+
+**Output ONLY valid JSON, no other text:**
+"""
+
 
 class LLMJobListExtractor:
     """
@@ -38,13 +117,25 @@ class LLMJobListExtractor:
             temperature=0.1  # Low temperature for consistent extraction
         )
         self.output_parser = StrOutputParser()
+        self._prompt_template = ChatPromptTemplate.from_template(JOB_LIST_PROMPT)
+        self._chain = self._prompt_template | self.llm | self.output_parser
     
-    @staticmethod
-    def _clean_html(html_text: str) -> str:
+    @classmethod
+    def _clean_html(cls, html_text: str) -> str:
         """Remove HTML tags and clean up text, but preserve structure."""
         # Remove script and style tags
-        html_text = re.sub(r'(?is)<(script|style).*?>.*?</\1>', '', html_text)
+        html_text = _SCRIPT_STYLE.sub('', html_text)
+        if len(html_text) <= _CLEAN_INPUT_LIMIT:
+            return cls._clean_html_text(html_text)
         
+        cleaned = cls._clean_html_text(html_text[:_CLEAN_INPUT_LIMIT])
+        if len(cleaned) < _CLEANED_HTML_LIMIT:
+            # Prefix was mostly markup; fall back to the full page
+            cleaned = cls._clean_html_text(html_text)
+        return cleaned
+    
+    @staticmethod
+    def _clean_html_text(html_text: str) -> str:
         # Replace common HTML entities
         html_text = html_text.replace('&nbsp;', ' ')
         html_text = html_text.replace('&amp;', '&')
@@ -53,10 +144,10 @@ class LLMJobListExtractor:
         html_text = html_text.replace('&quot;', '"')
         
         # Remove HTML tags but keep text content
-        html_text = re.sub(r'<[^>]+>', ' ', html_text)
+        html_text = _TAG.sub(' ', html_text)
         
         # Clean up whitespace
-        html_text = re.sub(r'\s+', ' ', html_text)
+        html_text = _WS.sub(' ', html_text)
         html_text = html_text.strip()
         
         return html_text
@@ -65,13 +156,24 @@ class LLMJobListExtractor:
     def _extract_links_from_html(html_text: str, base_url: str) -> List[Dict[str, str]]:
         """Extract all links from HTML using regex."""
         links = []
+        pos = 0
         # Find all <a> tags with href attributes
-        pattern = r'<a[^>]*href=["\']([^"\']+)["\'][^>]*>(.*?)</a>'
-        matches = re.finditer(pattern, html_text, re.IGNORECASE | re.DOTALL)
-        
-        for match in matches:
-            href = html.unescape(match.group(1))
-            text = html.unescape(re.sub(r'<[^>]+>', '', match.group(2))).strip()
+        while True:
+            match = _A_OPEN.search(html_text, pos)
+            if not match:
+                break
+            close = _A_CLOSE.search(html_text, match.end())
+            if not close:
+                break
+            pos = close.end()
+            
+            href = match.group(1)
+            if '&' in href:
+                href = html.unescape(href)
+            text = _TAG.sub('', html_text[match.end():close.start()])
+            if '&' in text:
+                text = html.unescape(text)
+            text = text.strip()
             
             # Normalize relative URLs
             if href.startswith('/'):
@@ -86,6 +188,40 @@ class LLMJobListExtractor:
         
         return links
     
+    @staticmethod
+    def _parse_jobs_json(response: str) -> List[JobItem]:
+        """Parse and validate the LLM reply; raises ValueError if malformed."""
+        response = response.strip()
+        
+        # Remove markdown code blocks if present
+        if response.startswith("```"):
+            response = re.sub(r'^```(?:json)?\s*', '', response)
+            response = re.sub(r'\s*```$', '', response)
+        
+        try:
+            data = _loads(response)
+        except ValueError:
+            # Try to extract JSON array from surrounding commentary
+            json_match = re.search(r'\[.*\]', response, re.DOTALL)
+            if not json_match:
+                raise
+            data = _loads(json_match.group(0))
+        
+        if isinstance(data, dict):
+            # Reply wrapped the array in an object, e.g. {"jobs": [...]}
+            data = next((v for v in data.values() if isinstance(v, list)), data)
+        if not isinstance(data, list):
+            raise ValueError("expected a JSON array of jobs")
+        # Validate item by item so one malformed entry is dropped instead of
+        # failing (and re-prompting for) the whole list
+        items: List[JobItem] = []
+        for item in data:
+            try:
+                items.append(JobItem.model_validate(item))
+            except ValidationError:
+                continue
+        return items
+    
     def extract_jobs_from_html(
         self,
         html_content: str,
@@ -110,8 +246,8 @@ class LLMJobListExtractor:
         
         # Clean HTML for LLM processing (limit size)
         cleaned_html = self._clean_html(html_content)
-        if len(cleaned_html) > 30000:  # Limit to ~30k chars
-            cleaned_html = cleaned_html[:30000] + "..."
+        if len(cleaned_html) > _CLEANED_HTML_LIMIT:  # Limit to ~30k chars
+            cleaned_html = cleaned_html[:_CLEANED_HTML_LIMIT] + "..."
         
         # Extract links text for context
         links_text = "\n".join([
@@ -119,101 +255,65 @@ class LLMJobListExtractor:
             for link in all_links[:200]  # Limit to first 200 links
         ])
         
-        # Build prompt for LLM
-        prompt_template = ChatPromptTemplate.from_template("""
-You are an expert at extracting job listings from career pages. Analyze the HTML content and links below to extract all job postings.
-
-**Company:** {company}
-**Base URL:** {base_url}
-
-**Available Links:**
-{links_text}
-
-**Page Content (first 30k chars):**
-{cleaned_html}
-
-**Instructions:**
-1. Identify all job postings on this page
-2. For each job, extract:
-   - Job title
-   - Job URL (must be a valid absolute URL)
-   - Location (if available)
-   - Brief description (if available, max 200 chars)
-
-3. Return results in this EXACT JSON format (array of objects):
-[
-  {{
-    "title": "Job Title",
-    "url": "https://full-url-to-job-posting",
-    "location": "City, State or Remote",
-    "description": "Brief job description"
-  }},
-  ...
-]
-
-**CRITICAL RULES:**
-- Only include jobs (not "Learn More", "About Us", etc.)
-- URLs MUST be absolute (start with http:// or https://)
-- URLs should point to individual job detail pages, not general pages
-- If URL is relative, make it absolute using base_url
-- Extract at most {max_jobs} jobs
-- If you can't find any jobs, return an empty array: []
-
-**Output ONLY valid JSON, no other text:**
-""")
-        
         try:
-            chain = prompt_template | self.llm | self.output_parser
-            response = chain.invoke({
+            inputs = {
                 "company": company or "Unknown",
                 "base_url": base_url,
                 "links_text": links_text[:5000],  # Limit links text
                 "cleaned_html": cleaned_html,
                 "max_jobs": max_jobs
-            })
-            
-            # Parse JSON response
-            response = response.strip()
+            }
+            response = self._chain.invoke(inputs)
             
-            # Remove markdown code blocks if present
-            if response.startswith("```"):
-                response = re.sub(r'^```(?:json)?\s*', '', response)
-                response = re.sub(r'\s*```$', '', response)
+            # Parse JSON response, feeding validation errors back to the LLM
+            messages = None
+            for attempt in range(_MAX_PARSE_RETRIES + 1):
+                try:
+                    jobs = self._parse_jobs_json(response)
+                    break
+                except ValueError as e:
+                    if attempt == _MAX_PARSE_RETRIES:
+                        raise
+                    print(f"[llm-extractor] Malformed JSON from LLM, retrying ({attempt + 1}/{_MAX_PARSE_RETRIES})")
+                    time.sleep(2 ** attempt)
+                    if messages is None:
+                        messages = self._prompt_template.format_messages(**inputs)
+                    messages += [
+                        AIMessage(content=response),
+                        HumanMessage(content=f"Your output had error: {e}. Return only a JSON array of jobs."),
+                    ]
+                    response = self.output_parser.invoke(self.llm.invoke(messages))
             
-            # Try to extract JSON array
-            json_match = re.search(r'\[.*\]', response, re.DOTALL)
-            if json_match:
-                import json
-                jobs = json.loads(json_match.group(0))
-            else:
-                # Try parsing entire response as JSON
-                import json
-                jobs = json.loads(response)
+            # Links from the page are already normalized; LLM URLs that match
+            # one can be used as-is, anything else must resolve to a page link.
+            link_map = {link["url"]: link for link in all_links}
             
             # Validate and normalize jobs
             validated_jobs = []
             for job in jobs:
-                if not isinstance(job, dict):
-                    continue
-                
-                title = (job.get("title") or "").strip()
-                url = (job.get("url") or "").strip()
+                title = (job.title or "").strip()
+                url = (job.url or "").strip()
                 
                 # Skip if no title or URL
                 if not title or not url:
                     continue
                 
-                # Ensure URL is absolute
-                if url.startswith('/'):
-                    url = urljoin(base_url, url)
-                elif not url.startswith('http'):
-                    url = urljoin(base_url, '/' + url)
+                if url not in link_map:
+                    # Ensure URL is absolute
+                    if url.startswith('/'):
+                        url = urljoin(base_url, url)
+                    elif not url.startswith('http'):
+                        url = urljoin(base_url, '/' + url)
+                    
+                    # Drop URLs that don't appear on the page (hallucinated/injected)
+                    if link_map and url not in link_map:
+                        continue
                 
                 validated_jobs.append({
                     "title": title,
                     "company": company or "",
-                    "location": (job.get("location") or "").strip(),
-                    "description": (job.get("description") or "").strip()[:500],
+                    "location": (job.location or "").strip(),
+                    "description": (job.description or "").strip()[:500],
                     "url": url,
                     "source": f"llm_extractor:{company or 'unknown'}"
                 })
@@ -37,6 +37,16 @@ if not os.path.exists(log_folder):
 log_path = Path(log_folder).resolve()
 logger.add(log_path / "gpt_resume.log", rotation="1 day", compression="zip", retention="7 days", level="DEBUG")
 
+EXTRACTION_PROMPT = """
+            You are an expert in extracting specific information from job descriptions. 
+            Carefully read the job description roles and responsibilities context below and provide a clear and concise answer to the question.
+
+            Context: {context}
+
+            Question: {question}
+            Answer:
+            """
+
 
 class LLMParser:
     def __init__(self, api_key, provider="openai"):
@@ -81,6 +91,9 @@ class LLMParser:
                 api_key=openai_key,
             )
 
+        self._extraction_prompt = ChatPromptTemplate.from_template(template=EXTRACTION_PROMPT)
+        self._extraction_chain = self._extraction_prompt | self.llm | StrOutputParser()
+
     @staticmethod
     def _preprocess_template_string(template: str) -> str:
         """
@@ -139,8 +152,7 @@ class LLMParser:
         if not self.vectorstore:
             raise ValueError("Vectorstore not initialized. Run extract_job_description first.")
         
-        retriever = self.vectorstore.as_retriever()
-        retrieved_docs = retriever.get_relevant_documents(query)[:top_k]
+        retrieved_docs = self.vectorstore.similarity_search(query, k=top_k)
         context = "\n\n".join(doc.page_content for doc in retrieved_docs)
         logger.debug(f"Context retrieved for query '{query}': {context[:200]}...")  # Log the first 200 characters
         return context
@@ -156,24 +168,11 @@ class LLMParser:
         """
         context = self._retrieve_context(retrieval_query)
         
-        prompt = ChatPromptTemplate.from_template(
-            template="""
-            You are an expert in extracting specific information from job descriptions. 
-            Carefully read the job description roles and responsibilities context below and provide a clear and concise answer to the question.
-
-            Context: {context}
-
-            Question: {question}
-            Answer:
-            """
-        )
-        
-        formatted_prompt = prompt.format(context=context, question=question)
+        formatted_prompt = self._extraction_prompt.format(context=context, question=question)
         logger.debug(f"Formatted prompt for extraction: {formatted_prompt[:200]}...")  # Log the first 200 characters
         
         try:
-            chain = prompt | self.llm | StrOutputParser()
-            result = chain.invoke({"context": context, "question": question})
+            result = self._extraction_chain.invoke({"context": context, "question": question})
             extracted_info = result.strip()
             logger.debug(f"Extracted information: {extracted_info}")
             return extracted_info
@@ -22,6 +22,7 @@ class LLMManager:
         self.config = config or {}
         self.provider = None
         self.client = None
+        self.model_name = None
         self._initialize()
     
     def _initialize(self):
@@ -76,6 +77,7 @@ class LLMManager:
                 model = genai.GenerativeModel(model_name)
                 self.client = model
                 self.provider = 'gemini'
+                self.model_name = model_name
                 print(f"✓ Using Google Gemini model: {model_name}")
                 return True
         except Exception as e:
@@ -95,6 +97,7 @@ class LLMManager:
                 model = os.getenv('OLLAMA_MODEL', 'llama3:8b')
                 self.client = get_ollama_client(model=model)
                 self.provider = 'ollama'
+                self.model_name = model
                 print(f"✓ Using Ollama ({model}) - FREE, LOCAL, UNLIMITED")
                 return True
         except Exception as e:
@@ -115,6 +118,7 @@ class LLMManager:
             if api_key:
                 self.client = OpenAI(api_key=api_key)
                 self.provider = 'openai'
+                self.model_name = os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
                 print("✓ Using OpenAI - PAID, LIMITED REQUESTS")
                 print("  (Set ENABLE_OPENAI=false to disable)")
                 return True
@@ -175,6 +179,7 @@ class LLMManager:
                     # Clear current client and try other providers
                     self.client = None
                     self.provider = None
+                    self.model_name = None
 
                     # Try Ollama first (unlimited), then OpenAI
                     if self._try_ollama() or self._try_openai():
@@ -212,7 +217,7 @@ class LLMManager:
     def _generate_openai(self, messages, temperature, max_tokens):
         """Generate with OpenAI"""
         response = self.client.chat.completions.create(
-            model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
+            model=self.model_name,
             messages=messages,
             temperature=temperature,
             max_tokens=max_tokens
@@ -221,19 +226,19 @@ class LLMManager:
     
     def _messages_to_prompt(self, messages):
         """Convert OpenAI-style messages to single prompt"""
-        prompt = ""
+        parts = []
         for msg in messages:
             role = msg.get("role", "user")
             content = msg.get("content", "")
             
             if role == "system":
-                prompt += f"System Instructions: {content}\n\n"
+                parts.append(f"System Instructions: {content}")
             elif role == "user":
-                prompt += f"User: {content}\n\n"
+                parts.append(f"User: {content}")
             elif role == "assistant":
-                prompt += f"Assistant: {content}\n\n"
+                parts.append(f"Assistant: {content}")
         
-        return prompt.strip()
+        return "\n\n".join(parts).strip()
 
 
 # Global instance
@@ -24,6 +24,19 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+EXTRACTION_PROMPT = textwrap.dedent("""
+    You are an expert at extracting specific information from job descriptions.
+    Carefully read the context below and provide a clear, concise answer to the question.
+    If the information is not available, respond with "Not specified".
+    
+    Context:
+    {context}
+    
+    Question: {question}
+    
+    Answer:
+    """)
+
 
 class LLMParser:
     """
@@ -47,6 +60,7 @@ class LLMParser:
             api_key=api_key,
         )
         self.vectorstore: Optional[FAISS] = None
+        self._chain = ChatPromptTemplate.from_template(EXTRACTION_PROMPT) | self.llm | StrOutputParser()
 
     @staticmethod
     def _preprocess_template_string(template: str) -> str:
@@ -97,8 +111,7 @@ class LLMParser:
         if not self.vectorstore:
             raise ValueError("Vectorstore not initialized. Call set_job_description() first.")
         
-        retriever = self.vectorstore.as_retriever()
-        retrieved_docs = retriever.invoke(query)[:top_k]
+        retrieved_docs = self.vectorstore.similarity_search(query, k=top_k)
         context = "\n\n".join(doc.page_content for doc in retrieved_docs)
         return context
 
@@ -115,24 +128,8 @@ class LLMParser:
         """
         context = self._retrieve_context(retrieval_query)
         
-        template = self._preprocess_template_string("""
-        You are an expert at extracting specific information from job descriptions.
-        Carefully read the context below and provide a clear, concise answer to the question.
-        If the information is not available, respond with "Not specified".
-        
-        Context:
-        {context}
-        
-        Question: {question}
-        
-        Answer:
-        """)
-        
-        prompt = ChatPromptTemplate.from_template(template)
-        chain = prompt | self.llm | StrOutputParser()
-        
         try:
-            result = chain.invoke({"context": context, "question": question})
+            result = self._chain.invoke({"context": context, "question": question})
             return result.strip()
         except Exception as e:
             return f"Error: {e}"
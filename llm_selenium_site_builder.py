@@ -8,9 +8,15 @@ compatible with the selenium scraper configuration.
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 import os
+import random
 import re
+import time
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
 from urllib.parse import urlparse
@@ -21,10 +27,18 @@ except Exception:
     openai_compat = None
 
 try:
-    from openai import OpenAI
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    from openai import AsyncOpenAI, RateLimitError
     OPENAI_AVAILABLE = True
 except Exception:
     OPENAI_AVAILABLE = False
+    AsyncOpenAI = None
+    RateLimitError = None
 
 try:
     import google.generativeai as genai
@@ -33,7 +47,21 @@ except Exception:
     GEMINI_AVAILABLE = False
 
 
+logger = logging.getLogger(__name__)
+
 MODEL_NAME = os.getenv("LLM_SITES_MODEL", "gpt-4o-mini")
+# Max in-flight LLM requests and attempts per request (rate-limit retries)
+MAX_CONCURRENCY = int(os.getenv("LLM_SITES_CONCURRENCY", "10"))
+MAX_ATTEMPTS = 3
+# Companies per LLM request; the output budget grows with the batch
+BATCH_SIZE = max(1, int(os.getenv("LLM_SITES_BATCH", "25")))
+MIN_MAX_TOKENS = 1200
+TOKENS_PER_COMPANY = 150
+# Published per-minute request/token limits used to pace requests proactively
+PROVIDER_LIMITS = {
+    "openai": {"rpm": 60, "tpm": 150_000},
+    "gemini": {"rpm": 60, "tpm": 1_000_000},
+}
 
 PROMPT_TEMPLATE = """
 You are an expert in identifying official job listing pages for companies.
@@ -49,6 +77,7 @@ COMPANY LIST:
 Respond with ONLY valid JSON in the following format (array of objects):
 [
   {{
+    "input": "Company name exactly as given in COMPANY LIST",
     "company": "company-slug",
     "url": "https://jobs.example.com/search",
     "careers_url": "https://www.example.com/careers/",
@@ -61,6 +90,8 @@ Respond with ONLY valid JSON in the following format (array of objects):
 ]
 
 Rules:
+- Return exactly one object per company, in the same order as COMPANY LIST.
+- input must repeat the company name exactly as it appears in COMPANY LIST.
 - company should be lowercase slug (spaces replaced by hyphen).
 - url should point directly to a listing/search page if possible.
 - careers_url should be the generic careers landing page.
@@ -78,6 +109,16 @@ DEFAULT_SELECTORS = {
 }
 
 
+_SLUG_RE = re.compile(r"[^a-z0-9\-]+")
+
+
+@lru_cache(maxsize=2048)
+def _url_parts(url: str) -> tuple[str, str]:
+    """Return (scheme, netloc) for url; cached since batches repeat hosts."""
+    parsed = urlparse(url)
+    return parsed.scheme, parsed.netloc
+
+
 def _clean_json_string(text: str) -> str:
     """Remove fenced code blocks or trailing text from an LLM response."""
     stripped = text.strip()
@@ -90,14 +131,13 @@ def _clean_json_string(text: str) -> str:
 def _standardize_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
     """Fill in defaults and ensure required fields are present."""
     company = (entry.get("company") or "").strip().lower()
-    company_slug = re.sub(r"[^a-z0-9\-]+", "-", company).strip("-") or company
+    company_slug = _SLUG_RE.sub("-", company).strip("-") or company
 
     url = (entry.get("url") or entry.get("job_search_url") or entry.get("jobs_url") or "").strip()
     careers_url = (entry.get("careers_url") or url or "").strip()
 
-    parsed = urlparse(url or careers_url)
-    domain = parsed.netloc
-    absolute_base = f"{parsed.scheme}://{parsed.netloc}" if parsed.scheme and parsed.netloc else ""
+    scheme, domain = _url_parts(url or careers_url)
+    absolute_base = f"{scheme}://{domain}" if scheme and domain else ""
 
     standardized = {
         "company": company_slug,
@@ -116,12 +156,8 @@ def _standardize_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
     return standardized
 
 
-def generate_selenium_site_entries(companies: List[str]) -> List[Dict[str, Any]]:
-    """Generate Selenium site configuration objects for the given companies."""
-    companies = [c.strip() for c in companies if c and c.strip()]
-    if not companies:
-        return []
-
+def _resolve_provider() -> tuple[str, str, str] | None:
+    """Pick the LLM provider and keys; returns None when no provider is usable."""
     # Check config.json to see if OpenAI is enabled
     openai_enabled_in_config = True
     try:
@@ -142,76 +178,237 @@ def generate_selenium_site_entries(companies: List[str]) -> List[Dict[str, Any]]
     if not openai_enabled_in_config and provider == "openai":
         if gemini_key:
             provider = "gemini"
-            print("[llm-selenium] OpenAI disabled in config, using Gemini")
+            logger.warning("[llm-selenium] OpenAI disabled in config, using Gemini")
         else:
-            print("[llm-selenium] OpenAI disabled and no Gemini key, skipping site generation")
-            return []
+            logger.warning("[llm-selenium] OpenAI disabled and no Gemini key, skipping site generation")
+            return None
     
     if provider == "openai" and not openai_key:
         if gemini_key:
             provider = "gemini"
-            print("[llm-selenium] OpenAI key missing, falling back to Gemini")
+            logger.warning("[llm-selenium] OpenAI key missing, falling back to Gemini")
         else:
-            print("[llm-selenium] No LLM API keys found, skipping site generation")
-            return []
-            
-    prompt = PROMPT_TEMPLATE.format(company_list="\n".join(f"- {c}" for c in companies))
-    raw_text = ""
-    
-    if provider == "openai":
-        try:
-            client = OpenAI(api_key=openai_key)
-            response = client.chat.completions.create(
-                model=MODEL_NAME,
-                messages=[
-                    {"role": "system", "content": "You generate structured JSON for Selenium job scrapers."},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.2,
-                max_tokens=1200,
-            )
-            raw_text = response.choices[0].message.content or ""
-        except Exception as exc:
-            print(f"[llm-selenium] OpenAI request failed: {exc}")
-            return []
-    elif provider == "gemini":
-        if not GEMINI_AVAILABLE:
-            print("[llm-selenium] Gemini library not available")
-            return []
-        try:
-            genai.configure(api_key=gemini_key)
-            model = genai.GenerativeModel("gemini-1.5-flash")
-            response = model.generate_content(prompt)
-            raw_text = response.text or ""
-        except Exception as exc:
-            print(f"[llm-selenium] Gemini request failed: {exc}")
-            return []
-    else:
-        print(f"[llm-selenium] Unsupported provider: {provider}")
-        return []
-
+            logger.warning("[llm-selenium] No LLM API keys found, skipping site generation")
+            return None
+
+    if provider == "openai" and not OPENAI_AVAILABLE:
+        logger.warning("[llm-selenium] OpenAI library not available")
+        return None
+    if provider == "gemini" and not GEMINI_AVAILABLE:
+        logger.warning("[llm-selenium] Gemini library not available")
+        return None
+    if provider not in ("openai", "gemini"):
+        logger.warning("[llm-selenium] Unsupported provider: %s", provider)
+        return None
+    return provider, openai_key, gemini_key
+
+
+class RateLimiter:
+    """Sliding-window RPM/TPM limiter with AIMD concurrency control.
+
+    acquire() waits until a request fits within the last minute's request and
+    token budget and under the current concurrency limit. release() halves the
+    concurrency limit after a rate-limit error and raises it by one after a
+    success, up to max_concurrency.
+    """
+
+    WINDOW_SECONDS = 60.0
+
+    def __init__(self, rpm: int, tpm: int, max_concurrency: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_concurrency = max(1, max_concurrency)
+        self.concurrency = float(self.max_concurrency)
+        self._in_flight = 0
+        self._tokens_in_window = 0
+        self._events: deque[tuple[float, int]] = deque()
+        self._cond = asyncio.Condition()
+
+    def _expire(self, now: float) -> None:
+        while self._events and now - self._events[0][0] >= self.WINDOW_SECONDS:
+            _, tokens = self._events.popleft()
+            self._tokens_in_window -= tokens
+
+    async def acquire(self, est_tokens: int) -> None:
+        async with self._cond:
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+                fits_tokens = not self._events or self._tokens_in_window + est_tokens <= self.tpm
+                if (
+                    self._in_flight < int(self.concurrency)
+                    and len(self._events) < self.rpm
+                    and fits_tokens
+                ):
+                    self._events.append((now, est_tokens))
+                    self._tokens_in_window += est_tokens
+                    self._in_flight += 1
+                    return
+                # Sleep until a request finishes or the oldest window entry expires
+                timeout = None
+                if self._events:
+                    timeout = max(0.0, self.WINDOW_SECONDS - (now - self._events[0][0]))
+                try:
+                    await asyncio.wait_for(self._cond.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def release(self, rate_limited: bool = False) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            if rate_limited:
+                self.concurrency = max(1.0, self.concurrency * 0.5)
+            else:
+                self.concurrency = min(float(self.max_concurrency), self.concurrency + 1)
+            self._cond.notify_all()
+
+
+def _is_rate_limit(exc: Exception) -> bool:
+    if RateLimitError is not None and isinstance(exc, RateLimitError):
+        return True
+    error_str = str(exc).lower()
+    return any(phrase in error_str for phrase in (
+        "rate limit", "quota", "429", "too many requests", "resource_exhausted", "resourceexhausted",
+    ))
+
+
+def _parse_site_entries(raw_text: str, companies: List[str] | None = None) -> List[Dict[str, Any]]:
+    """Parse the LLM reply into standardized site entries.
+
+    When companies is given, entries whose "input" echoes a company that was
+    not in the request are dropped as misaligned.
+    """
     if not raw_text:
-        print("[llm-selenium] Empty response content for site generation.")
+        logger.warning("[llm-selenium] Empty response content for site generation.")
         return []
 
     cleansed = _clean_json_string(raw_text)
     try:
-        parsed = json.loads(cleansed)
-    except json.JSONDecodeError as exc:
-        print(f"[llm-selenium] Failed to parse JSON from LLM: {exc}\nRaw:\n{cleansed}")
+        parsed = _loads(cleansed)
+    except ValueError as exc:
+        logger.warning("[llm-selenium] Failed to parse JSON from LLM: %s\nRaw:\n%s", exc, cleansed)
         return []
 
     if isinstance(parsed, dict):
         parsed = [parsed]
     if not isinstance(parsed, list):
-        print("[llm-selenium] Unexpected JSON structure from LLM (expected list).")
+        logger.warning("[llm-selenium] Unexpected JSON structure from LLM (expected list).")
         return []
 
+    expected = {c.strip().lower() for c in companies} if companies else None
+    seen: set[str] = set()
     standardized_entries = []
     for entry in parsed:
         if not isinstance(entry, dict):
             continue
+        echoed = str(entry.get("input") or "").strip().lower()
+        if expected is not None and echoed:
+            if echoed not in expected:
+                logger.warning("[llm-selenium] Dropping entry for unrequested company: %s", entry.get('input'))
+                continue
+            seen.add(echoed)
         standardized_entries.append(_standardize_entry(entry))
 
+    if expected is not None and seen:
+        missing = [c for c in companies if c.strip().lower() not in seen]
+        if missing:
+            logger.warning("[llm-selenium] No entry returned for: %s", ', '.join(missing))
+
     return standardized_entries
 
+
+async def _agenerate_batch(
+    companies: List[str],
+    provider: str,
+    client: Any,
+    limiter: RateLimiter,
+) -> List[Dict[str, Any]]:
+    """Request site entries for one batch of companies, retrying on rate limits."""
+    prompt = PROMPT_TEMPLATE.format(company_list="\n".join(f"- {c}" for c in companies))
+    label = "OpenAI" if provider == "openai" else "Gemini"
+    max_tokens = max(MIN_MAX_TOKENS, TOKENS_PER_COMPANY * len(companies))
+    est_tokens = len(prompt) // 4 + max_tokens
+    raw_text = ""
+
+    for attempt in range(MAX_ATTEMPTS):
+        await limiter.acquire(est_tokens)
+        try:
+            if provider == "openai":
+                response = await client.chat.completions.create(
+                    model=MODEL_NAME,
+                    messages=[
+                        {"role": "system", "content": "You generate structured JSON for Selenium job scrapers."},
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=0.2,
+                    max_tokens=max_tokens,
+                )
+                raw_text = response.choices[0].message.content or ""
+            else:
+                response = await client.generate_content_async(prompt)
+                raw_text = response.text or ""
+        except Exception as exc:
+            rate_limited = _is_rate_limit(exc)
+            await limiter.release(rate_limited)
+            if rate_limited and attempt < MAX_ATTEMPTS - 1:
+                # Exponential backoff with jitter: ~1s, ~2s, ...
+                wait_time = 2 ** attempt + random.uniform(0, 1)
+                logger.warning("[llm-selenium] %s rate limited, retrying in %.1fs (attempt %s/%s)", label, wait_time, attempt + 1, MAX_ATTEMPTS)
+                await asyncio.sleep(wait_time)
+                continue
+            logger.warning("[llm-selenium] %s request failed: %s", label, exc)
+            return []
+        await limiter.release()
+        break
+
+    return _parse_site_entries(raw_text, companies)
+
+
+async def agenerate_selenium_site_entries(companies_batches: List[List[str]]) -> List[Dict[str, Any]]:
+    """Generate site entries for several company batches concurrently.
+
+    Batches are sent in parallel (at most MAX_CONCURRENCY in flight) through a
+    single async client; results are concatenated in batch order.
+    """
+    batches = [
+        [c.strip() for c in batch if c and c.strip()]
+        for batch in companies_batches
+    ]
+    batches = [batch for batch in batches if batch]
+    if not batches:
+        return []
+
+    resolved = _resolve_provider()
+    if resolved is None:
+        return []
+    provider, openai_key, gemini_key = resolved
+
+    if provider == "openai":
+        # No SDK retries: _agenerate_batch is the only retry layer, so 429s reach the limiter
+        client = AsyncOpenAI(api_key=openai_key, max_retries=0)
+    else:
+        genai.configure(api_key=gemini_key)
+        client = genai.GenerativeModel("gemini-1.5-flash")
+
+    limits = PROVIDER_LIMITS[provider]
+    limiter = RateLimiter(limits["rpm"], limits["tpm"], MAX_CONCURRENCY)
+    try:
+        results = await asyncio.gather(
+            *(_agenerate_batch(batch, provider, client, limiter) for batch in batches)
+        )
+    finally:
+        if provider == "openai":
+            # Close the httpx pool on this loop; asyncio.run closes the loop after each call
+            await client.close()
+    return [entry for batch_entries in results for entry in batch_entries]
+
+
+def generate_selenium_site_entries(companies: List[str]) -> List[Dict[str, Any]]:
+    """Generate Selenium site configuration objects for the given companies.
+
+    Companies are split into BATCH_SIZE chunks (one LLM request each) which
+    are sent concurrently.
+    """
+    companies = [c.strip() for c in companies if c and c.strip()]
+    batches = [companies[i:i + BATCH_SIZE] for i in range(0, len(companies), BATCH_SIZE)]
+    return asyncio.run(agenerate_selenium_site_entries(batches))
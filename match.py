@@ -1,11 +1,15 @@
 import argparse
 import fnmatch
+import heapq
 import json
+import operator
 import os
 import re
 import sys
 import csv
+import itertools
 from datetime import datetime
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
 from pathlib import Path
 from typing import Any, List, Tuple
@@ -25,6 +29,23 @@ if load_dotenv:
     load_dotenv()
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    # orjson parses/serializes large API payloads and outputs several times faster.
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+try:
+    # requests-cache backs the shared session with SQLite when MATCH_HTTP_CACHE is set.
+    import requests_cache  # type: ignore
+except Exception:
+    requests_cache = None
+try:
+    # ijson streams big job-board arrays so we can stop after fetch_limit items.
+    import ijson  # type: ignore
+except Exception:
+    ijson = None
 try:
     # Prefer rapidfuzz if available (much faster + better token-set scoring).
     from rapidfuzz import fuzz  # type: ignore
@@ -61,6 +82,13 @@ except Exception:
             return max(_ratio(s1, s2), _ratio(s1, s3), _ratio(s2, s3))
 
     fuzz = _FuzzFallback()
+try:
+    # Batched native scorer (releases the GIL, can use all cores); needs numpy.
+    import numpy as np  # type: ignore
+    from rapidfuzz import process as rf_process  # type: ignore
+except Exception:
+    np = None
+    rf_process = None
 try:
     # centralize config helpers
     from config import load_json, resolve_from_config  # type: ignore
@@ -173,9 +201,142 @@ except Exception:
 from resume_utils import load_resume_data
 
 _non_alnum = re.compile(r"[^a-z0-9+#.\-\s]")
+# ASCII fast path for _non_alnum: a 256-byte bytes.translate table (one C pass,
+# no regex stepping). Whitespace maps to " " too, which split() treats the same.
+_FUZZ_KEEP = frozenset(b"abcdefghijklmnopqrstuvwxyz0123456789+#.-")
+_FUZZ_TABLE = bytes(c if c in _FUZZ_KEEP else 0x20 for c in range(256))
 _html_strip_re = re.compile(r"<[^>]+>")
+# First non-empty line of a text; search stops at its newline, nothing else is copied
+_FIRST_LINE_RE = re.compile(r"\S[^\n]*")
 _html_script_style_re = re.compile(r"(?is)<(script|style).*?>.*?</\\1>")
 
+# Shared HTTP session for every fetch in this module: pooled keep-alive
+# connections, retries on connect errors and transient 429/5xx responses
+# (read timeouts are not retried so slow pages don't multiply the wait).
+_DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/126.0 Safari/537.36"
+)
+_HTTP_RETRY = Retry(
+    total=3,
+    read=0,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+)
+# Accept-Encoding is left to requests/urllib3, which advertise (and decode) br
+# automatically when the brotli package is installed.
+_JSON_HEADERS = {"Accept": "application/json"}
+# Optional on-disk response cache for repeated runs (development, cron re-runs):
+# set MATCH_HTTP_CACHE to a SQLite path. Board APIs change slowly, SerpApi
+# results are kept shorter, and anything else falls back to 30 minutes.
+_HTTP_CACHE_EXPIRY = {
+    "boards-api.greenhouse.io": 3600,
+    "api.lever.co": 3600,
+    "serpapi.com": 1800,
+}
+
+
+def _make_cache_backend() -> Any:
+    cache_path = os.getenv("MATCH_HTTP_CACHE", "").strip()
+    if cache_path and requests_cache is not None:
+        return requests_cache.SQLiteCache(cache_path)
+    if cache_path:
+        print("[http] MATCH_HTTP_CACHE is set but requests-cache is not installed; caching disabled")
+    return None
+
+
+# Resolved once and shared by both sessions, so they use one SQLite connection
+# set and write lock instead of contending for the same file
+_HTTP_CACHE_BACKEND = _make_cache_backend()
+
+
+def _make_session() -> requests.Session:
+    if _HTTP_CACHE_BACKEND is not None:
+        return requests_cache.CachedSession(
+            backend=_HTTP_CACHE_BACKEND,
+            expire_after=1800,
+            allowable_methods=("GET",),
+            urls_expire_after=_HTTP_CACHE_EXPIRY,
+        )
+    return requests.Session()
+
+
+_SESSION = _make_session()
+_SESSION.headers["User-Agent"] = _DEFAULT_USER_AGENT
+_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=_HTTP_RETRY))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=_HTTP_RETRY))
+# Job-description pages: fetch_job_description_from_url runs its own retry loop,
+# so this pooled session does no adapter-level retries (they would multiply).
+_PAGE_SESSION = _make_session()
+_PAGE_SESSION.headers["User-Agent"] = _DEFAULT_USER_AGENT
+_PAGE_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0))
+_PAGE_SESSION.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0))
+
+# Concurrency for hosted job-board fetches: company listings, plus one detail
+# pool shared by every Greenhouse company, so in-flight requests stay within the
+# adapter's pool_maxsize (16 + 16 <= 64)
+_COMPANY_FETCH_WORKERS = 16
+_GREENHOUSE_DETAIL_WORKERS = 16
+
+def _json_loads(data: bytes | str) -> Any:
+    """Decode JSON bytes/text, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _fetch_json_array(url: str, key: str | None, limit: int, timeout: int = 30) -> list[Any]:
+    """GET url and return at most limit items of a JSON array.
+
+    key=None means the body itself is the array, otherwise it lives under
+    body[key]. With ijson installed the body is parsed as it streams in and the
+    connection is dropped once limit items are read.
+    """
+    with _SESSION.get(url, timeout=timeout, stream=True, headers=_JSON_HEADERS) as resp:
+        resp.raise_for_status()
+        # Cache hits (MATCH_HTTP_CACHE) are already in memory; only stream live responses
+        if ijson is not None and not getattr(resp, "from_cache", False):
+            resp.raw.decode_content = True
+            prefix = "item" if key is None else f"{key}.item"
+            return list(itertools.islice(ijson.items(resp.raw, prefix, use_float=True), limit))
+        payload = _json_loads(resp.content)
+    if key is not None:
+        payload = payload.get(key) if isinstance(payload, dict) else None
+    return payload[:limit] if isinstance(payload, list) else []
+
+
+def _write_json(path: Path, obj: Any) -> None:
+    """Write obj as indented JSON to path, preferring orjson when installed."""
+    if orjson is not None:
+        payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        # Encode in one C call; json.dump issues a write per token through the text codec
+        payload = json.dumps(obj, indent=2).encode("utf-8")
+    # Serialize fully before opening, so the file is created, written once and closed
+    _atomic_write_bytes(Path(path), payload)
+
+
+def _link_output(src: Path, dst: Path) -> bool:
+    """Hard-link an identical output file; False if the filesystem refuses."""
+    try:
+        os.link(src, dst)
+        return True
+    except OSError:
+        return False
+
+
+def _tmp_path(path: Path) -> Path:
+    return path.with_name(path.name + ".tmp")
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write data to a sibling temp file and os.replace it over path, so
+    readers never see a half-written output."""
+    tmp = _tmp_path(path)
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
 def _normalize_meta_field(value: str | None) -> str:
     """Normalize company/role/location fields, stripping placeholder text."""
     if not value:
@@ -189,10 +350,20 @@ def _normalize_meta_field(value: str | None) -> str:
 
 def tokenize_for_fuzz(text: str) -> str:
     text = (text or "").lower()
-    text = _non_alnum.sub(" ", text)
+    if text.isascii():
+        text = text.encode("ascii").translate(_FUZZ_TABLE).decode("ascii")
+    else:
+        text = _non_alnum.sub(" ", text)
     return " ".join(t for t in text.split() if len(t) > 1)
 
 
+@lru_cache(maxsize=4096)
+def _tokenize_short(text: str) -> str:
+    """Memoized tokenize_for_fuzz for short, frequently repeated strings
+    (target roles, titles, query terms). Don't use it for descriptions."""
+    return tokenize_for_fuzz(text)
+
+
 # Common stopwords to exclude from skill extraction
 STOPWORDS = {
     "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "he",
@@ -207,6 +378,16 @@ STOPWORDS = {
 }
 
 
+# Very small stopword list for query derivation; this keeps implementation simple and domain-agnostic
+_QUERY_STOPWORDS = frozenset({
+    "the", "and", "for", "with", "that", "this", "from", "have", "will",
+    "your", "their", "they", "them", "into", "over", "under", "above",
+    "below", "more", "less", "than", "such", "including", "across",
+    "within", "between", "other", "role", "responsible", "experience",
+    "years", "year", "work", "working", "team", "teams",
+})
+
+
 def build_query_from_resume(resume_text: str, max_terms: int = 12) -> str:
     """
     Automatically derive a search query from the resume text, without requiring
@@ -224,31 +405,15 @@ def build_query_from_resume(resume_text: str, max_terms: int = 12) -> str:
     if not tokens:
         return ""
 
-    # Very small stopword list; this keeps implementation simple and domain-agnostic
-    stopwords = {
-        "the", "and", "for", "with", "that", "this", "from", "have", "will",
-        "your", "their", "they", "them", "into", "over", "under", "above",
-        "below", "more", "less", "than", "such", "including", "across",
-        "within", "between", "other", "role", "responsible", "experience",
-        "years", "year", "work", "working", "team", "teams",
-    }
-
-    filtered = [t for t in tokens if len(t) > 3 and t not in stopwords]
+    filtered = [t for t in tokens if len(t) > 3 and t not in _QUERY_STOPWORDS]
     if not filtered:
         return ""
 
     # 1-gram frequencies
     uni_counter = Counter(filtered)
 
-    # 2-gram (bigram) frequencies, built from adjacent tokens
-    bigrams: list[str] = []
-    for i in range(len(filtered) - 1):
-        w1, w2 = filtered[i], filtered[i + 1]
-        if w1 in stopwords or w2 in stopwords:
-            continue
-        phrase = f"{w1} {w2}"
-        bigrams.append(phrase)
-    bi_counter = Counter(bigrams)
+    # 2-gram (bigram) frequencies, built from adjacent tokens (already stopword-free)
+    bi_counter = Counter(f"{w1} {w2}" for w1, w2 in zip(filtered, filtered[1:]))
 
     # Build final list preferring bigrams, then unigrams
     terms: list[str] = []
@@ -272,13 +437,19 @@ def build_query_from_resume(resume_text: str, max_terms: int = 12) -> str:
 ## cover-letter free text generation now lives in CoverLetterBuilder.compose_concise_text
 
 
-def _normalize_country_name(country: str | None) -> tuple[str, list[str]]:
+_USA_ALIASES = ("united states", "united states of america", "usa", "us", "u.s.")
+
+
+@lru_cache(maxsize=64)
+def _normalize_country_name(country: str | None) -> tuple[str, tuple[str, ...]]:
+    """Return (normalized country, location aliases); memoized because the
+    country filter calls it once per job with the same configured country."""
     if not country:
-        return "", []
+        return "", ()
     c = country.strip().lower()
-    if c in {"usa", "us", "u.s.", "united states", "united states of america"}:
-        return "usa", ["united states", "united states of america", "usa", "us", "u.s."]
-    return c, [c]
+    if c in _USA_ALIASES:
+        return "usa", _USA_ALIASES
+    return c, (c,)
 
 
 def _matches_country(location_value: str | None, country: str | None) -> bool:
@@ -290,7 +461,7 @@ def _matches_country(location_value: str | None, country: str | None) -> bool:
     # Always allow fully remote entries
     if "remote" in loc:
         return True
-    norm, aliases = _normalize_country_name(country)
+    _, aliases = _normalize_country_name(country)
     return any(alias in loc for alias in aliases)
 
 
@@ -340,12 +511,12 @@ def _matches_job_type(description: str | None, title: str | None, required_type:
     return True
 def load_jobs(local: str | None, url: str | None, here: Path) -> list[dict[str, Any]]:
     if local:
-        with open(local, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(local, "rb") as f:
+            return _json_loads(f.read())
     if url:
-        resp = requests.get(url, timeout=20)
+        resp = _SESSION.get(url, timeout=20, headers=_JSON_HEADERS)
         resp.raise_for_status()
-        return resp.json()
+        return _json_loads(resp.content)
     # No fallback to sample file; return empty list so other sources (e.g., Selenium) can run
     return []
 
@@ -498,17 +669,13 @@ def _html_to_text(html: str) -> str:
 def _fetch_lever_jobs(slug: str, display_name: str, fetch_limit: int) -> List[dict[str, Any]]:
     url = f"https://api.lever.co/v0/postings/{slug}?mode=json"
     try:
-        resp = requests.get(url, timeout=30)
-        resp.raise_for_status()
-        postings = resp.json()
-        if not isinstance(postings, list):
-            return []
+        postings = _fetch_json_array(url, None, fetch_limit)
     except Exception as exc:
         print(f"[lever] Failed to fetch postings for {slug}: {exc}")
         return []
 
     jobs: List[dict[str, Any]] = []
-    for post in postings[:fetch_limit]:
+    for post in postings:
         if not isinstance(post, dict):
             continue
         title = post.get("text") or post.get("title")
@@ -537,15 +704,16 @@ def _fetch_lever_jobs(slug: str, display_name: str, fetch_limit: int) -> List[di
     return jobs
 
 
-def _fetch_greenhouse_jobs(slug: str, display_name: str, fetch_limit: int, country_filter: str | None = None) -> List[dict[str, Any]]:
+def _fetch_greenhouse_jobs(
+    slug: str,
+    display_name: str,
+    fetch_limit: int,
+    country_filter: str | None = None,
+    detail_pool: ThreadPoolExecutor | None = None,
+) -> List[dict[str, Any]]:
     api_url = f"https://boards-api.greenhouse.io/v1/boards/{slug}/jobs"
     try:
-        resp = requests.get(api_url, timeout=30)
-        resp.raise_for_status()
-        payload = resp.json()
-        jobs_payload = payload.get("jobs") if isinstance(payload, dict) else None
-        if not isinstance(jobs_payload, list):
-            return []
+        jobs_payload = _fetch_json_array(api_url, "jobs", fetch_limit)
     except Exception as exc:
         print(f"[greenhouse] Failed to fetch jobs for {slug}: {exc}")
         return []
@@ -566,7 +734,8 @@ def _fetch_greenhouse_jobs(slug: str, display_name: str, fetch_limit: int, count
         else:
             aliases = [norm_country]
 
-    for job in jobs_payload[:fetch_limit]:
+    candidates: list[tuple[Any, str, str, str]] = []
+    for job in jobs_payload:
         if not isinstance(job, dict):
             continue
         job_id = job.get("id")
@@ -585,17 +754,30 @@ def _fetch_greenhouse_jobs(slug: str, display_name: str, fetch_limit: int, count
                 # Skip non-matching locations
                 continue
 
-        description_text = ""
+        candidates.append((job_id, title, absolute_url, location))
+
+    def _fetch_detail(job_id: Any) -> str:
         detail_url = f"https://boards-api.greenhouse.io/v1/boards/{slug}/jobs/{job_id}"
         try:
-            detail_resp = requests.get(detail_url, timeout=30)
+            detail_resp = _SESSION.get(detail_url, timeout=30, headers=_JSON_HEADERS)
             detail_resp.raise_for_status()
-            detail_payload = detail_resp.json()
+            detail_payload = _json_loads(detail_resp.content)
             if isinstance(detail_payload, dict):
-                description_text = _html_to_text(detail_payload.get("content", ""))
+                return _html_to_text(detail_payload.get("content", ""))
         except Exception as exc:
             print(f"[greenhouse] Failed to fetch detail for {slug}/{job_id}: {exc}")
+        return ""
+
+    # Detail pages are independent, so fetch them in a second pooled wave
+    # (on the caller's shared pool when given, so companies don't each add workers)
+    descriptions: list[str] = []
+    if candidates and detail_pool is not None:
+        descriptions = list(detail_pool.map(_fetch_detail, [c[0] for c in candidates]))
+    elif candidates:
+        with ThreadPoolExecutor(max_workers=min(_GREENHOUSE_DETAIL_WORKERS, len(candidates))) as executor:
+            descriptions = list(executor.map(_fetch_detail, [c[0] for c in candidates]))
 
+    for (job_id, title, absolute_url, location), description_text in zip(candidates, descriptions):
         jobs.append({
             "title": title.strip(),
             "company": display_name,
@@ -613,23 +795,39 @@ def fetch_company_source_jobs(company_sources_cfg: dict[str, Any], fetch_limit:
     if not company_sources_cfg:
         return jobs
 
+    # (fetcher, args) per company; executed concurrently, merged in config order
+    tasks: list[tuple[Any, tuple]] = []
+
     lever_cfg = company_sources_cfg.get("lever") or {}
     if lever_cfg.get("enabled"):
         entries = _normalize_company_entries(lever_cfg.get("companies"))
         per_company_limit = max(1, fetch_limit // max(1, len(entries))) if entries else fetch_limit
         for raw_name, slug in entries:
             display = raw_name or slug
-            jobs.extend(_fetch_lever_jobs(slug, display, per_company_limit))
+            tasks.append((_fetch_lever_jobs, (slug, display, per_company_limit)))
 
     greenhouse_cfg = company_sources_cfg.get("greenhouse") or {}
+    detail_pool: ThreadPoolExecutor | None = None
     if greenhouse_cfg.get("enabled"):
+        detail_pool = ThreadPoolExecutor(max_workers=_GREENHOUSE_DETAIL_WORKERS)
         entries = _normalize_company_entries(greenhouse_cfg.get("companies"))
         per_company_limit = max(1, fetch_limit // max(1, len(entries))) if entries else fetch_limit
         # Allow per-provider override: company_sources.greenhouse.country
         gh_country = (greenhouse_cfg.get("country") or country_filter)
         for raw_name, slug in entries:
             display = raw_name or slug
-            jobs.extend(_fetch_greenhouse_jobs(slug, display, per_company_limit, gh_country))
+            tasks.append((_fetch_greenhouse_jobs, (slug, display, per_company_limit, gh_country, detail_pool)))
+
+    try:
+        if not tasks:
+            return jobs
+        with ThreadPoolExecutor(max_workers=min(_COMPANY_FETCH_WORKERS, len(tasks))) as executor:
+            futures = [executor.submit(fn, *fn_args) for fn, fn_args in tasks]
+            for future in futures:
+                jobs.extend(future.result())
+    finally:
+        if detail_pool is not None:
+            detail_pool.shutdown(wait=True)
 
     return jobs
 
@@ -643,9 +841,9 @@ def fetch_serpapi_google_jobs(query: str, location: str | None, api_key: str, fe
     }
     if location:
         params["location"] = location
-    resp = requests.get("https://serpapi.com/search.json", params=params, timeout=60)  # Increased from 30 to 60
+    resp = _SESSION.get("https://serpapi.com/search.json", params=params, timeout=60, headers=_JSON_HEADERS)  # Increased from 30 to 60
     resp.raise_for_status()
-    data = resp.json()
+    data = _json_loads(resp.content)
     items = data.get("jobs_results", []) or []
 
     results: list[dict[str, Any]] = []
@@ -686,7 +884,7 @@ def fetch_job_description_plain(url: str, max_chars: int = 12000) -> str:
                 "(KHTML, like Gecko) Chrome/126.0 Safari/537.36"
             )
         }
-        resp = requests.get(url, timeout=60, headers=headers)  # Increased from 20 to 60
+        resp = _SESSION.get(url, timeout=60, headers=headers)  # Increased from 20 to 60
         resp.raise_for_status()
         html_text = resp.text
     except Exception:
@@ -831,13 +1029,13 @@ def _title_matches_target_role(title: str, target_roles: list[str], min_ratio: f
     """
     if not title or not target_roles:
         return False
-    title_clean = tokenize_for_fuzz(title)
+    title_clean = _tokenize_short(title)
     if not title_clean:
         return False
     for role in target_roles:
         if not role:
             continue
-        role_clean = tokenize_for_fuzz(str(role))
+        role_clean = _tokenize_short(str(role))
         if not role_clean:
             continue
         try:
@@ -913,7 +1111,7 @@ def fetch_job_description_from_url(url: str, timeout: int = 15, max_retries: int
                 'Connection': 'keep-alive',
             }
             
-            response = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+            response = _PAGE_SESSION.get(url, headers=headers, timeout=timeout, allow_redirects=True)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -1035,14 +1233,17 @@ def enrich_jobs_with_descriptions(
     # Step 1: Filter jobs that match keywords
     print(f"\n[keyword-match] Checking {len(jobs)} jobs for keyword matches...")
     matching_jobs = []
+    # One stdout write for the whole match list instead of a print per job
+    lines = []
     
     for job in jobs:
         if keyword_matches_job(job, target_roles, resume_skills):
             matching_jobs.append(job)
             title = job.get("title", "")[:50]
             company = job.get("company", "")
-            print(f"  ✅ Match: {company} - {title}")
+            lines.append(f"  ✅ Match: {company} - {title}\n")
     
+    sys.stdout.write("".join(lines))
     print(f"[keyword-match] Found {len(matching_jobs)} jobs matching keywords")
     
     if not matching_jobs:
@@ -1102,22 +1303,54 @@ def enrich_jobs_with_descriptions(
     return final_jobs
 
 
-def score_job(job: dict[str, Any], resume_text: str) -> float:
-    title = job.get("title", "")
-    fields = "\n".join([
-        job.get("title", ""),
-        job.get("company", ""),
-        job.get("location", ""),
-        job.get("description", ""),
-    ])
+_TITLE_BOOST_RE = re.compile(r"mlops|machine\s+learning|data\s+engineer|full\s*stack|python", re.IGNORECASE)
+
+
+def _job_fields_text(job: dict[str, Any]) -> str:
+    return "\n".join(
+        str(job.get(key) or "") for key in ("title", "company", "location", "description")
+    )
+
+
+def score_job(job: dict[str, Any], resume_text: str, resume_tok: str | None = None) -> float:
+    """Fuzzy-score a job against the resume.
+
+    Pass resume_tok (tokenize_for_fuzz(resume_text)) when scoring many jobs so
+    the resume is tokenized once rather than per job.
+    """
+    title = str(job.get("title") or "")
+    if resume_tok is None:
+        resume_tok = tokenize_for_fuzz(resume_text)
     # token-set fuzzy similarity
-    sim = fuzz.token_set_ratio(tokenize_for_fuzz(resume_text), tokenize_for_fuzz(fields))
+    sim = fuzz.token_set_ratio(resume_tok, tokenize_for_fuzz(_job_fields_text(job)))
     # boost relevant titles
-    if re.search(r"mlops|machine\s+learning|data\s+engineer|full\s*stack|python", title.lower()):
+    if _TITLE_BOOST_RE.search(title):
         sim += 10
     return float(sim)
 
 
+def score_jobs(jobs: list[dict[str, Any]], resume_tok: str, workers: int = -1) -> list[float]:
+    """Score a batch of jobs against a pre-tokenized resume.
+
+    Equivalent to score_job per job, but runs the fuzzy scorer in a single
+    rapidfuzz cdist call (native loop, `workers` threads) when available.
+    """
+    if not jobs:
+        return []
+    choices = [tokenize_for_fuzz(_job_fields_text(job)) for job in jobs]
+    boosted = [bool(_TITLE_BOOST_RE.search(str(job.get("title") or ""))) for job in jobs]
+    if rf_process is None or np is None:
+        return [
+            float(fuzz.token_set_ratio(resume_tok, choice)) + (10.0 if boost else 0.0)
+            for choice, boost in zip(choices, boosted)
+        ]
+    sims = rf_process.cdist(
+        [resume_tok], choices, scorer=fuzz.token_set_ratio, dtype=np.float64, workers=workers
+    )[0]
+    sims = np.where(np.asarray(boosted), sims + 10.0, sims)
+    return sims.tolist()
+
+
 ## resolve_from_config and load_json are provided by config.py
 
 
@@ -1126,32 +1359,49 @@ def _arg_present(flag: str) -> bool:
     return False
 
 
-def write_csv(rows: list[dict[str, Any]], csv_path: Path) -> None:
-    fields = ["title", "company", "location", "country", "score", "url", "careers_url", "source", "description"]
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fields)
-        w.writeheader()
-        url_count = 0
-        missing_url_count = 0
-        for r in rows:
-            url = r.get("url", "") or ""
-            if url:
-                url_count += 1
-            else:
-                missing_url_count += 1
-                print(f"  [csv-debug] Missing URL for: {r.get('company', 'N/A')} - {r.get('title', 'N/A')[:50]}")
-            w.writerow({
-                "title": r.get("title", ""),
-                "company": r.get("company", ""),
-                "location": r.get("location", ""),
-                "country": r.get("country", ""),
-                "score": r.get("score", ""),
-                "url": url,  # Ensure URL is written as-is
-                "careers_url": r.get("careers_url", ""),
-                "source": r.get("source", ""),
-                "description": (r.get("description", "") or "").replace("\r", " ").replace("\n", " ")
-            })
-        print(f"  [csv-debug] Wrote {len(rows)} rows: {url_count} with URLs, {missing_url_count} without URLs")
+_CSV_FIELDS = ("title", "company", "location", "country", "score", "url", "careers_url", "source", "description")
+_CSV_SCORE_IDX = _CSV_FIELDS.index("score")
+_NL_RE = re.compile(r"[\r\n]+")
+
+
+def _csv_row(r: dict[str, Any]) -> tuple:
+    return (
+        r.get("title", ""),
+        r.get("company", ""),
+        r.get("location", ""),
+        r.get("country", ""),
+        r.get("score", ""),
+        r.get("url", "") or "",  # Ensure URL is written as-is
+        r.get("careers_url", ""),
+        r.get("source", ""),
+        _NL_RE.sub(" ", r.get("description", "") or ""),
+    )
+
+
+def write_csv(
+    rows: list[dict[str, Any]],
+    csv_path: Path,
+    staged: list[tuple] | None = None,
+    log: list[str] | None = None,
+) -> None:
+    """Write rows to csv_path; staged may carry pre-built _csv_row tuples for rows.
+    When log is given, the [csv-debug] lines are appended to it instead of printed
+    (for writes running on worker threads)."""
+    emit = print if log is None else log.append
+    missing_url_count = 0
+    for r in rows:
+        if not (r.get("url", "") or ""):
+            missing_url_count += 1
+            emit(f"  [csv-debug] Missing URL for: {r.get('company', 'N/A')} - {r.get('title', 'N/A')[:50]}")
+    # Write to a temp file and swap it in atomically (see _atomic_write_bytes)
+    tmp_path = _tmp_path(Path(csv_path))
+    with open(tmp_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        w = csv.writer(f)
+        w.writerow(_CSV_FIELDS)
+        w.writerows(staged if staged is not None else (_csv_row(r) for r in rows))
+    os.replace(tmp_path, csv_path)
+    url_count = len(rows) - missing_url_count
+    emit(f"  [csv-debug] Wrote {len(rows)} rows: {url_count} with URLs, {missing_url_count} without URLs")
 
 
 def run_discovery(resume_text: str, resume_structured: dict, resolved_cfg: dict, here: Path) -> Tuple[list[dict[str, Any]], list[dict[str, Any]]]:
@@ -1182,9 +1432,8 @@ def run_discovery(resume_text: str, resume_structured: dict, resolved_cfg: dict,
     print(f"[debug] local_jobs_file candidate: {local_jobs_file}")
     if local_jobs_file and Path(local_jobs_file).exists():
         try:
-            import json as std_json
-            with open(local_jobs_file, "r") as f:
-                local_jobs = std_json.load(f)
+            with open(local_jobs_file, "rb") as f:
+                local_jobs = _json_loads(f.read())
             if isinstance(local_jobs, list):
                 print(f"[fetch] Loaded {len(local_jobs)} jobs from {local_jobs_file}")
                 fetched.extend(local_jobs)
@@ -1196,13 +1445,36 @@ def run_discovery(resume_text: str, resume_structured: dict, resolved_cfg: dict,
 
     selenium_sites = load_selenium_sites_from_opts(selenium_opts)
 
+    def _fetch_serpapi() -> list[dict[str, Any]]:
+        print(f"[serpapi] Fetching jobs for query: {query}")
+        try:
+            serp_jobs = fetch_serpapi_google_jobs(
+                query=query,
+                location=location,
+                api_key=serpapi_key,
+                fetch_limit=int(resolved_cfg.get("fetch_limit", 200))
+            )
+            if serp_jobs:
+                print(f"[serpapi] Found {len(serp_jobs)} jobs via SerpApi")
+            return serp_jobs or []
+        except Exception as e:
+            print(f"[serpapi] ⚠️ Error fetching from SerpApi: {e}")
+            return []
+
+    # The network sources are independent: start them together so they overlap
+    # each other and the LLM site generation below. Results are still merged in
+    # the original order (company sources, SerpApi, pre-defined jobs).
     company_sources_cfg = resolved_cfg.get("company_sources") or {}
-    hosted_jobs = fetch_company_source_jobs(
+    source_pool = ThreadPoolExecutor(max_workers=3)
+    hosted_future = source_pool.submit(
+        fetch_company_source_jobs,
         company_sources_cfg,
         int(resolved_cfg.get("fetch_limit", 200)),
         country_filter=country,
     )
-    fetched += hosted_jobs
+    serp_future = source_pool.submit(_fetch_serpapi) if serpapi_key and query else None
+    local_future = source_pool.submit(load_jobs, jobs_arg, jobs_url_arg, here)
+    source_pool.shutdown(wait=False)
 
     source_sites, source_companies = generate_company_source_sites(company_sources_cfg)
     if source_sites:
@@ -1284,27 +1556,20 @@ def run_discovery(resume_text: str, resume_structured: dict, resolved_cfg: dict,
             cfg_companies = combined
             resolved_cfg["companies"] = combined
 
+    # Collect the company-source jobs only now, after site generation has run
+    # alongside the fetch
+    fetched += hosted_future.result()
+
     # Add SerpApi results if available
-    if serpapi_key and query:
-        print(f"[serpapi] Fetching jobs for query: {query}")
-        try:
-            serp_jobs = fetch_serpapi_google_jobs(
-                query=query,
-                location=location,
-                api_key=serpapi_key,
-                fetch_limit=int(resolved_cfg.get("fetch_limit", 200))
-            )
-            if serp_jobs:
-                fetched.extend(serp_jobs)
-                print(f"[serpapi] Found {len(serp_jobs)} jobs via SerpApi")
-        except Exception as e:
-            print(f"[serpapi] ⚠️ Error fetching from SerpApi: {e}")
+    if serp_future is not None:
+        fetched.extend(serp_future.result())
 
     def _dedupe_by_url(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        seen: set[str] = set()
+        seen: set[Any] = set()
         out: list[dict[str, Any]] = []
         for it in items:
-            key = (it.get("url") or f"{it.get('title','')}|{it.get('company','')}|{it.get('location','')}")
+            # URL-less jobs key on a (title, company, location) tuple; no f-string per item
+            key = it.get("url") or (it.get("title", ""), it.get("company", ""), it.get("location", ""))
             if key in seen:
                 continue
             seen.add(key)
@@ -1312,7 +1577,7 @@ def run_discovery(resume_text: str, resume_structured: dict, resolved_cfg: dict,
         return out
 
     # Load pre-defined jobs if any
-    local_jobs = load_jobs(jobs_arg, jobs_url_arg, here)
+    local_jobs = local_future.result()
     if isinstance(local_jobs, dict) and 'items' in local_jobs:
         local_jobs = local_jobs['items']
     if isinstance(local_jobs, list):
@@ -1499,24 +1764,17 @@ def run_discovery(resume_text: str, resume_structured: dict, resolved_cfg: dict,
             max_workers=resolved_cfg.get("parallel_workers", 20)  # Increased from 5 to 20 for faster fetching
         )
     
-    def score_single_job(job: dict[str, Any]) -> dict[str, Any]:
-        s = score_job(job, resume_text)
-        cval = "usa" if _matches_country(job.get("location"), "usa") else ""
-        return {**job, "score": round(s, 2), "country": cval}
-    
-    scored = []
-    from concurrent.futures import ThreadPoolExecutor as Executor, as_completed
-    max_score_workers = min(int(resolved_cfg.get("parallel_workers", 20) or 20), len(fetched) or 1)  # Increased for faster scoring
-    with Executor(max_workers=max_score_workers) as executor:
-        future_to_job = {executor.submit(score_single_job, job): job for job in fetched}
-        for future in as_completed(future_to_job):
-            try:
-                scored.append(future.result())
-            except Exception:
-                job = future_to_job[future]
-                scored.append({**job, "score": 0.0, "country": ""})
-    
-    scored.sort(key=lambda x: x["score"], reverse=True)
+    resume_tok = tokenize_for_fuzz(resume_text)
+    sims = score_jobs(fetched, resume_tok)
+    # Every job left after a USA country filter already matched "usa", so the
+    # country column only needs its own location check for other filters
+    all_usa = _normalize_country_name(country)[0] == "usa"
+    # fetched is not used after scoring, so annotate the job dicts in place
+    # rather than copying every job (and its description) into a new dict
+    for job, s in zip(fetched, sims):
+        job["score"] = round(s, 2)
+        job["country"] = "usa" if all_usa or _matches_country(job.get("location"), "usa") else ""
+    scored = fetched
     
     # Apply min_score filter
     min_score_threshold = float(resolved_cfg.get("min_score", 25))
@@ -1526,6 +1784,15 @@ def run_discovery(resume_text: str, resume_structured: dict, resolved_cfg: dict,
         print(f"[filter] Removed {pre_filter_count - len(scored)} jobs below min_score threshold ({min_score_threshold})")
     
     top_n = int(resolved_cfg.get("top", 10))
+    # Only the top-N / top-50 outputs need ordering unless the full fetched list is saved
+    ranked = max(top_n, 50)
+    by_score = operator.itemgetter("score")
+    if resolved_cfg.get("save_fetched") or len(scored) <= ranked:
+        scored.sort(key=by_score, reverse=True)
+    else:
+        best = heapq.nlargest(ranked, scored, key=by_score)
+        chosen = {id(j) for j in best}
+        scored = best + [j for j in scored if id(j) not in chosen]
     return scored, scored[:top_n]
 
 
@@ -1615,8 +1882,7 @@ def main() -> None:
     if not scored:
         out_file = Path(out_path)
         out_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(out_file, "w", encoding="utf-8") as f:
-            json.dump([], f, indent=2)
+        _write_json(out_file, [])
         csv_path = Path(csv_path_str)
         write_csv([], csv_path)
         print(f"[score] No jobs fetched. Wrote empty outputs: {out_file} and {csv_path}")
@@ -1631,31 +1897,54 @@ def main() -> None:
 
     out_file = Path(out_path)
     out_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(out_file, "w", encoding="utf-8") as f:
-        json.dump(top, f, indent=2)
+
+    # Build CSV rows (with the description scrub) once; top N and top-50 are
+    # prefixes of the sorted scored list, and the fetched CSV reuses every row.
+    save_fetched = bool(resolved_cfg.get("save_fetched") or False)
+    staged = [_csv_row(r) for r in scored[: len(scored) if save_fetched else max(len(top), 50)]]
 
     # CSV path for top N
     csv_path = out_file.with_suffix('.csv')
-    write_csv(top, csv_path)
 
-    # Save fetched list (JSON/CSV) if requested
+    # Fetched list (JSON/CSV) if requested, and always a top-50 alongside configured top
     stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     fetched_json = out_file.parent / f"fetched_jobs_{stamp}.json"
     fetched_csv = out_file.parent / f"fetched_jobs_{stamp}.csv"
-    if (resolved_cfg.get("save_fetched") or False):
-        with open(fetched_json, "w", encoding="utf-8") as f:
-            json.dump(fetched, f, indent=2)
-        # add dummy score column for CSV uniformity
-        fetched_rows = [{**j, "score": "", "country": ("usa" if _matches_country(j.get("location"), "usa") else "")} for j in fetched]
-        write_csv(fetched_rows, fetched_csv)
-
-    # Always also produce top-50 alongside configured top
     top50 = scored[:50]
     top50_json = out_file.parent / f"top50_jobs_{stamp}.json"
     top50_csv = out_file.parent / f"top50_jobs_{stamp}.csv"
-    with open(top50_json, "w", encoding="utf-8") as f:
-        json.dump(top50, f, indent=2)
-    write_csv(top50, top50_csv)
+    # When top N already holds the same rows (small boards or top >= 50), the
+    # top-50 files would be byte-identical: hard-link them instead of rewriting
+    same_rows = len(top50) == len(top)
+
+    # The output files are independent, so write them concurrently (file I/O
+    # releases the GIL) and wait for all of them before moving on. CSV debug
+    # lines are collected per file and printed from this thread afterwards.
+    csv_logs: list[list[str]] = []
+    with ThreadPoolExecutor(max_workers=4) as writer_pool:
+        writes = [writer_pool.submit(_write_json, out_file, top)]
+        csv_logs.append([])
+        writes.append(writer_pool.submit(write_csv, top, csv_path, staged[: len(top)], csv_logs[-1]))
+        if save_fetched:
+            # blank score column for CSV uniformity
+            fetched_staged = [row[:_CSV_SCORE_IDX] + ("",) + row[_CSV_SCORE_IDX + 1:] for row in staged]
+            writes.append(writer_pool.submit(_write_json, fetched_json, fetched))
+            csv_logs.append([])
+            writes.append(writer_pool.submit(write_csv, fetched, fetched_csv, fetched_staged, csv_logs[-1]))
+        if not same_rows:
+            writes.append(writer_pool.submit(_write_json, top50_json, top50))
+            csv_logs.append([])
+            writes.append(writer_pool.submit(write_csv, top50, top50_csv, staged[: len(top50)], csv_logs[-1]))
+        for fut in writes:
+            fut.result()
+    for lines in csv_logs:
+        if lines:
+            print("\n".join(lines))
+    if same_rows:
+        if not _link_output(out_file, top50_json):
+            _write_json(top50_json, top50)
+        if not _link_output(csv_path, top50_csv):
+            write_csv(top50, top50_csv, staged[: len(top50)])
 
     # Generate cover letters for top 100 (concise, three-paragraph letters; no greeting/signature)
     if (COVER_LETTER_AVAILABLE or LLM_RESUMER_AVAILABLE or JOB_APP_GENERATOR_AVAILABLE) and top:
@@ -1666,9 +1955,8 @@ def main() -> None:
             candidate_name = ""
             if resume_structured:
                 candidate_name = (resume_structured.get("basics") or {}).get("name", "") or ""
-            name_line = candidate_name.strip() or next(
-                (ln.strip() for ln in resume_text.splitlines() if ln.strip()), "Candidate"
-            )
+            first_line = _FIRST_LINE_RE.search(resume_text)
+            name_line = candidate_name.strip() or (first_line.group(0).strip() if first_line else "Candidate")
             openai_cfg = resolved_cfg.get("openai") or {}
             use_openai = bool(openai_cfg.get("enabled"))
             openai_model = (openai_cfg.get("model") or "").strip()
@@ -2132,7 +2420,7 @@ def main() -> None:
                                 "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0 Safari/537.36"
                             )
                         }
-                        resp = requests.get(job_url, timeout=60, headers=headers)  # Increased from 30 to 60
+                        resp = _SESSION.get(job_url, timeout=60, headers=headers)  # Increased from 30 to 60
                         resp.raise_for_status()
                         html_content = resp.text
                         job_html_parser = LLMJobHTMLParser(openai_key)
@@ -2272,7 +2560,7 @@ def main() -> None:
                                     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0 Safari/537.36"
                                 )
                             }
-                            resp = requests.get(job_url, timeout=60, headers=headers)  # Increased from 30 to 60
+                            resp = _SESSION.get(job_url, timeout=60, headers=headers)  # Increased from 30 to 60
                             resp.raise_for_status()
                             html_content = resp.text
                             job_html_parser = LLMJobHTMLParser(openai_key)
@@ -2344,14 +2632,13 @@ def main() -> None:
                     if (not jd_text or len(jd_text) < 100) and job_url and use_job_desc_extractor:
                         try:
                             with print_lock: print(f"  [extractor] Fetching page and extracting with LLM...")
-                            import requests
                             headers = {
                                 "User-Agent": (
                                     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
                                     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0 Safari/537.36"
                                 )
                             }
-                            resp = requests.get(job_url, timeout=60, headers=headers)  # Increased from 30 to 60
+                            resp = _SESSION.get(job_url, timeout=60, headers=headers)  # Increased from 30 to 60
                             resp.raise_for_status()
                             extracted = job_desc_extractor.extract_job_description(resp.text, company, role)
                             if extracted and extracted.get("description"):
@@ -3139,19 +3426,24 @@ def main() -> None:
     print(f"  - target_roles: {len(target_roles)} ({', '.join(target_roles[:3])}...)")
     print("="*80 + "\n")
     
-    print("Top matches:")
+    # Build the final report and emit it with a single write
+    lines = ["Top matches:"]
     for j in top:
         line = f"- [{j['score']}] {j.get('title','')} @ {j.get('company','')} ({j.get('location','')})"
         if j.get("url"):
             line += f" - {j['url']}"
-        print(line)
-    print("Saved to:", os.path.abspath(out_file))
-    print("CSV saved to:", os.path.abspath(csv_path))
+        lines.append(line)
+    # Every output lives next to out_file, so resolve that directory once
+    out_dir = os.path.abspath(out_file.parent)
+    lines.append(f"Saved to: {os.path.join(out_dir, out_file.name)}")
+    lines.append(f"CSV saved to: {os.path.join(out_dir, csv_path.name)}")
     if resolved_cfg.get("save_fetched"):
-        print("Fetched JSON:", os.path.abspath(fetched_json))
-        print("Fetched CSV:", os.path.abspath(fetched_csv))
-    print("Top50 JSON:", os.path.abspath(top50_json))
-    print("Top50 CSV:", os.path.abspath(top50_csv))
+        lines.append(f"Fetched JSON: {os.path.join(out_dir, fetched_json.name)}")
+        lines.append(f"Fetched CSV: {os.path.join(out_dir, fetched_csv.name)}")
+    lines.append(f"Top50 JSON: {os.path.join(out_dir, top50_json.name)}")
+    lines.append(f"Top50 CSV: {os.path.join(out_dir, top50_csv.name)}")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 import json
 import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -11,6 +12,7 @@ except Exception:
 
 from docx import Document
 
+from resume_utils import openai_client, squeeze_lines
 from resume_builder_templates import (
     prompt_header_template,
     prompt_education_template,
@@ -28,6 +30,19 @@ except Exception:
     _OPENAI = False
 
 
+@lru_cache(maxsize=64)
+def _openai_tailor(api_key: str, model: str, system: str, user: str) -> str:
+    """Tailoring completion memoized on the full prompt, so a JD seen again
+    (reposts, repeat web_app runs) skips the API call. Errors are not cached."""
+    resp = openai_client(api_key).chat.completions.create(
+        model=model,
+        messages=[{"role": "system", "content": system}, {"role": "user", "content": user}],
+        temperature=0.5,
+        max_tokens=6000,
+    )
+    return (resp.choices[0].message.content or "").strip()
+
+
 def _read_cfg(path: Path) -> Dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
@@ -100,7 +115,6 @@ def tailor_resume_for_job(
     if not _OPENAI:
         return resume_text
     try:
-        client = OpenAI(api_key=key)
         system = (
             "You are an expert resume writer specializing in ATS optimization. "
             "Given a resume and job description, rewrite the resume to highlight relevant skills, "
@@ -108,18 +122,12 @@ def tailor_resume_for_job(
         )
         user = (
             f"Company: {company}\nRole: {role}\n\n"
-            f"Job Description:\n{jd_text}\n\n"
+            f"Job Description:\n{squeeze_lines(jd_text)}\n\n"
             f"Current Resume:\n{resume_text}\n\n"
             "Task: Rewrite the resume to emphasize skills and experience matching the job description. "
             "Keep the same structure and facts; optimize keyword placement for ATS. Output plain text only."
         )
-        resp = client.chat.completions.create(
-            model=model,
-            messages=[{"role": "system", "content": system}, {"role": "user", "content": user}],
-            temperature=0.5,
-            max_tokens=6000,
-        )
-        return (resp.choices[0].message.content or "").strip()
+        return _openai_tailor(key, model, system, user)
     except Exception as e:
         print(f"[resume_builder] tailor error: {e}")
         return resume_text
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Iterable, Tuple
 
@@ -9,6 +10,22 @@ except Exception:
     yaml = None  # type: ignore
 
 
+@lru_cache(maxsize=8)
+def openai_client(api_key: str) -> Any:
+    """One OpenAI client per key, shared by the letter and tailoring calls so
+    concurrent jobs reuse its connection pool. The SDK retries 429s and
+    timeouts with backoff."""
+    from openai import OpenAI  # type: ignore
+
+    return OpenAI(api_key=api_key, max_retries=4)
+
+
+def squeeze_lines(text: str | None) -> str:
+    """Strip padding and blank lines so the same JD scraped from different
+    boards yields the same prompt (and LLM cache key)."""
+    return "\n".join(ln.strip() for ln in (text or "").splitlines() if ln.strip())
+
+
 def load_resume_data(path: Path) -> Tuple[str, dict[str, Any] | None]:
     """
     Load resume content. Supports plain text and YAML.
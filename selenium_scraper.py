@@ -6,6 +6,7 @@ from urllib.parse import urljoin, urlparse
 import os
 import re
 import html
+import threading
 
 try:
     from selenium import webdriver
@@ -62,6 +63,54 @@ _NON_JOB_TITLE_HINTS = [
     "key hiring areas",
 ]
 
+
+# Returns one plain dict per job container (or one for the whole page when the
+# container selector matches nothing) with every text/attribute the extraction
+# fallbacks below need, so each site costs a single WebDriver round-trip.
+_SNAPSHOT_ATTRS = [
+    "aria-label", "title", "data-title", "data-job-title", "data-name", "data-label",
+    "data-url", "data-href", "data-link", "data-job-url", "data-jobid", "data-id",
+    "onclick", "id", "data-job-id", "data-job-requisition-id",
+]
+_SNAPSHOT_JS = """
+const [containerSel, titleSels, locSel, descSel, linkSel, attrNames] = arguments;
+const first = (root, sel) => {
+  if (!sel) return null;
+  try { return root.querySelector(sel); } catch (e) { return null; }
+};
+// Unrendered nodes (display:none or under a hidden ancestor) have no client
+// rects; innerText would return their full text, WebElement.text returned "".
+const text = (el) => (el && el.getClientRects().length && el.innerText) || "";
+const href = (el) => {
+  if (!el) return "";
+  const v = typeof el.href === "string" ? el.href : el.getAttribute && el.getAttribute("href");
+  return v || "";
+};
+let roots = [];
+if (containerSel) {
+  try { roots = Array.from(document.querySelectorAll(containerSel)); } catch (e) { roots = []; }
+}
+if (!roots.length) roots = [document];
+return roots.map((root) => {
+  const isElem = root.nodeType === 1;
+  const attrs = {};
+  if (isElem) {
+    for (const name of attrNames) attrs[name] = root.getAttribute(name) || "";
+  }
+  return {
+    titles: titleSels.map((s) => { const n = first(root, s); return n ? text(n) : null; }),
+    headings: ["h1", "h2", "h3", "h4", "h5", "h6"].map((t) => text(first(root, t))),
+    location: text(first(root, locSel)),
+    description: text(first(root, descSel)),
+    link: href(first(root, linkSel)),
+    href: isElem ? href(root) : "",
+    anchors: Array.from(root.querySelectorAll("a")).map(href),
+    attrs: attrs,
+    text: isElem ? text(root) : "",
+  };
+});
+"""
+
 def _clean_extracted_title(title: str) -> str:
     """
     Generic cleanup for noisy titles scraped from cards/aria-labels.
@@ -158,6 +207,19 @@ def _heuristic_extract_job_links(page_source: str, base_url: str) -> list[dict[s
 
     return results
 
+# ChromeDriver path resolved by webdriver-manager; install() does a network
+# version probe on every call, so resolve it once per process.
+_CHROMEDRIVER_PATH: str | None = None
+_CHROMEDRIVER_LOCK = threading.Lock()
+
+
+def _chromedriver_path() -> str:
+    global _CHROMEDRIVER_PATH
+    with _CHROMEDRIVER_LOCK:
+        if _CHROMEDRIVER_PATH is None:
+            _CHROMEDRIVER_PATH = ChromeDriverManager().install()
+        return _CHROMEDRIVER_PATH
+
 
 def create_chrome_driver(headless: bool = True, window_size: str = "1920,1080") -> Any:
     if not SELENIUM_AVAILABLE:
@@ -188,7 +250,7 @@ def create_chrome_driver(headless: bool = True, window_size: str = "1920,1080")
     chrome_options.add_argument("--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36")
     # Prefer webdriver-manager if installed; otherwise rely on Selenium Manager (Selenium 4.6+).
     if _WDM_AVAILABLE and ChromeDriverManager is not None:
-        service = ChromeService(ChromeDriverManager().install())
+        service = ChromeService(_chromedriver_path())
         driver = webdriver.Chrome(service=service, options=chrome_options)
     else:
         # Selenium Manager will resolve the driver automatically when no Service is provided.
@@ -201,10 +263,17 @@ def create_headless_driver() -> Any:
     return create_chrome_driver(headless=True)
 
 
-def fetch_selenium_sites(sites: list[Any], fetch_limit: int) -> list[dict[str, Any]]:
+def fetch_selenium_sites(sites: list[Any], fetch_limit: int, driver: Any = None) -> list[dict[str, Any]]:
+    """Scrape job listings from Selenium sites.
+
+    Pass driver to reuse an existing browser; it is then left open for the
+    caller. Otherwise a headless driver is created and quit when done.
+    """
     if not SELENIUM_AVAILABLE:
         return []
-    driver = create_headless_driver()
+    owns_driver = driver is None
+    if owns_driver:
+        driver = create_headless_driver()
     if driver is None:
         return []
     results: list[dict[str, Any]] = []
@@ -358,14 +427,22 @@ def fetch_selenium_sites(sites: list[Any], fetch_limit: int) -> list[dict[str, A
             except Exception as scroll_err:
                 print(f"[selenium] scroll error: {scroll_err}")
             
-            items = []
-            if list_sel:
-                items = driver.find_elements(By.CSS_SELECTOR, list_sel)
-            elif item_sel:
-                items = driver.find_elements(By.CSS_SELECTOR, item_sel)
-            # Fallback to page-level if no container selector
-            if not items:
-                items = [driver]
+            # Snapshot every container in one execute_script round-trip instead
+            # of several find_elements/.text/get_attribute calls per item.
+            title_sels = [s.strip() for s in title_sel.split(',')] if title_sel else []
+            try:
+                items = driver.execute_script(
+                    _SNAPSHOT_JS,
+                    list_sel or item_sel,
+                    title_sels,
+                    loc_sel,
+                    desc_sel,
+                    link_sel,
+                    _SNAPSHOT_ATTRS,
+                ) or []
+            except Exception as snap_err:
+                print(f"[selenium] snapshot failed for {url}: {snap_err}")
+                items = []
 
             # Debug: counts per site
             try:
@@ -375,77 +452,54 @@ def fetch_selenium_sites(sites: list[Any], fetch_limit: int) -> list[dict[str, A
                 pass
 
             processed_count = 0
-            for idx, elem in enumerate(items):
+            for idx, snap in enumerate(items):
                 try:
                     processed_count += 1
                     title = ""
                     location = ""
                     link = ""
                     description = ""
+                    attrs = snap.get("attrs") or {}
                     
                     # Title extraction - try multiple methods
                     # Method 1: Use title_selector
-                    if title_sel:
-                        try:
-                            # Try each selector in the comma-separated list
-                            for sel in title_sel.split(','):
-                                sel = sel.strip()
-                                t_nodes = elem.find_elements(By.CSS_SELECTOR, sel)
-                                if t_nodes:
-                                    title = t_nodes[0].text.strip()
-                                    if title:
-                                        print(f"  [selenium-debug] Title Method 1 ({sel}) found: {title[:50]}")
-                                        break
-                        except Exception as e:
-                            print(f"  [selenium-debug] Title Method 1 failed: {e}")
+                    for sel, txt in zip(title_sels, snap.get("titles") or []):
+                        title = (txt or "").strip()
+                        if title:
+                            print(f"  [selenium-debug] Title Method 1 ({sel}) found: {title[:50]}")
+                            break
                     
                     # Method 2: Try common title patterns if still no title
                     if not title:
-                        try:
-                            # Try h1-h6 tags
-                            for tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                                headings = elem.find_elements(By.TAG_NAME, tag)
-                                if headings:
-                                    title = headings[0].text.strip()
-                                    if title:
-                                        print(f"  [selenium-debug] Title Method 2 ({tag}) found: {title[:50]}")
-                                        break
-                        except Exception:
-                            pass
+                        # Try h1-h6 tags
+                        for tag, txt in zip(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'], snap.get("headings") or []):
+                            title = (txt or "").strip()
+                            if title:
+                                print(f"  [selenium-debug] Title Method 2 ({tag}) found: {title[:50]}")
+                                break
                     
                     # Method 3: Try aria-label or title attribute
                     if not title:
-                        try:
-                            title = elem.get_attribute("aria-label") or elem.get_attribute("title") or ""
-                            title = title.strip()
-                            if title:
-                                print(f"  [selenium-debug] Title Method 3 (aria-label/title) found: {title[:50]}")
-                        except Exception:
-                            pass
+                        title = (attrs.get("aria-label") or attrs.get("title") or "").strip()
+                        if title:
+                            print(f"  [selenium-debug] Title Method 3 (aria-label/title) found: {title[:50]}")
                     
                     # Method 4: Try data attributes
                     if not title:
-                        try:
-                            for attr in ['data-title', 'data-job-title', 'data-name', 'data-label']:
-                                title = elem.get_attribute(attr) or ""
-                                title = title.strip()
-                                if title:
-                                    print(f"  [selenium-debug] Title Method 4 (data-{attr}) found: {title[:50]}")
-                                    break
-                        except Exception:
-                            pass
+                        for attr in ['data-title', 'data-job-title', 'data-name', 'data-label']:
+                            title = (attrs.get(attr) or "").strip()
+                            if title:
+                                print(f"  [selenium-debug] Title Method 4 (data-{attr}) found: {title[:50]}")
+                                break
                     
                     # Method 5: Get text from element itself (fallback)
                     if not title:
-                        try:
-                            txt = getattr(elem, 'text', '') or ''
-                            # Get first non-empty line
-                            lines = [l.strip() for l in txt.split('\n') if l.strip()]
-                            if lines:
-                                title = lines[0][:200]  # Limit length
-                                print(f"  [selenium-debug] Title Method 5 (element text) found: {title[:50]}")
-                        except Exception:
-                            pass
+                        txt = snap.get("text") or ''
+                        # Get first non-empty line
+                        lines = [l.strip() for l in txt.split('\n') if l.strip()]
+                        if lines:
+                            title = lines[0][:200]  # Limit length
+                            print(f"  [selenium-debug] Title Method 5 (element text) found: {title[:50]}")
                     
                     # Method 6: Extract from URL if still no title
                     if not title and link:
@@ -463,30 +517,24 @@ def fetch_selenium_sites(sites: list[Any], fetch_limit: int) -> list[dict[str, A
                     
                     # Location
                     if loc_sel:
-                        l_nodes = elem.find_elements(By.CSS_SELECTOR, loc_sel)
-                        if l_nodes:
-                            location = l_nodes[0].text.strip()
+                        location = (snap.get("location") or "").strip()
                     
                     # Description
                     if desc_sel:
-                        d_nodes = elem.find_elements(By.CSS_SELECTOR, desc_sel)
-                        if d_nodes:
-                            description = d_nodes[0].text.strip()
+                        description = (snap.get("description") or "").strip()
                     
                     # Link extraction - try multiple methods
                     # Method 1: Use link_selector
                     if link_sel:
-                        l_nodes = elem.find_elements(By.CSS_SELECTOR, link_sel)
-                        if l_nodes:
-                            link = l_nodes[0].get_attribute("href") or ""
-                            if link and not link.startswith('javascript:'):
-                                print(f"  [selenium-debug] Method 1 (link_sel) found: {link[:80]}")
-                            elif link.startswith('javascript:'):
-                                link = ""  # Reset invalid JavaScript links
+                        link = snap.get("link") or ""
+                        if link and not link.startswith('javascript:'):
+                            print(f"  [selenium-debug] Method 1 (link_sel) found: {link[:80]}")
+                        elif link.startswith('javascript:'):
+                            link = ""  # Reset invalid JavaScript links
                     
                     # Method 2: Check if element itself is a link
-                    if not link and hasattr(elem, 'get_attribute'):
-                        link = elem.get_attribute('href') or ""
+                    if not link:
+                        link = snap.get("href") or ""
                         if link and not link.startswith('javascript:'):
                             print(f"  [selenium-debug] Method 2 (elem href) found: {link[:80]}")
                         elif link.startswith('javascript:'):
@@ -494,86 +542,59 @@ def fetch_selenium_sites(sites: list[Any], fetch_limit: int) -> list[dict[str, A
                     
                     # Method 3: Find anchor tag within element
                     if not link:
-                        try:
-                            anchors = elem.find_elements(By.TAG_NAME, "a")
-                            if anchors:
-                                for anchor in anchors:
-                                    href = anchor.get_attribute("href") or ""
-                                    if href and not href.startswith('javascript:'):
-                                        link = href
-                                        print(f"  [selenium-debug] Method 3 (anchor tag) found: {link[:80]}")
-                                        break
-                        except Exception as e:
-                            print(f"  [selenium-debug] Method 3 failed: {e}")
+                        for href in snap.get("anchors") or []:
+                            if href and not href.startswith('javascript:'):
+                                link = href
+                                print(f"  [selenium-debug] Method 3 (anchor tag) found: {link[:80]}")
+                                break
                     
                     # Method 4: Check data attributes (BEFORE onclick, as they're more reliable)
                     if not link:
-                        try:
-                            for attr in ['data-url', 'data-href', 'data-link', 'data-job-url', 'data-jobid', 'data-id']:
-                                data_url = elem.get_attribute(attr) or ""
-                                if data_url:
-                                    # If it's a relative path, make it absolute
-                                    if data_url.startswith('/'):
-                                        data_url = urljoin(absolute_base, data_url)
-                                    # If it's just an ID, construct URL
-                                    elif not data_url.startswith('http') and '/' not in data_url:
-                                        # Try common patterns
-                                        if '/jobs/' in absolute_base or '/careers/' in absolute_base:
-                                            data_url = urljoin(absolute_base, f"/jobs/{data_url}")
-                                        else:
-                                            data_url = urljoin(absolute_base, f"/{data_url}")
-                                    
-                                    if data_url.startswith('http'):
-                                        link = data_url
-                                        print(f"  [selenium-debug] Method 4 (data-{attr}) found: {link[:80]}")
-                                        break
-                        except Exception:
-                            pass
+                        for attr in ['data-url', 'data-href', 'data-link', 'data-job-url', 'data-jobid', 'data-id']:
+                            data_url = attrs.get(attr) or ""
+                            if data_url:
+                                # If it's a relative path, make it absolute
+                                if data_url.startswith('/'):
+                                    data_url = urljoin(absolute_base, data_url)
+                                # If it's just an ID, construct URL
+                                elif not data_url.startswith('http') and '/' not in data_url:
+                                    # Try common patterns
+                                    if '/jobs/' in absolute_base or '/careers/' in absolute_base:
+                                        data_url = urljoin(absolute_base, f"/jobs/{data_url}")
+                                    else:
+                                        data_url = urljoin(absolute_base, f"/{data_url}")
+                                
+                                if data_url.startswith('http'):
+                                    link = data_url
+                                    print(f"  [selenium-debug] Method 4 (data-{attr}) found: {link[:80]}")
+                                    break
                     
                     # Method 5: If element is clickable, try to get URL from onclick
                     if not link:
-                        try:
-                            onclick = elem.get_attribute("onclick") or ""
-                            if onclick and "http" in onclick:
-                                import re
-                                urls = re.findall(r'https?://[^\s\'"]+', onclick)
-                                if urls:
-                                    link = urls[0]
-                                    print(f"  [selenium-debug] Method 5 (onclick) found: {link[:80]}")
-                        except Exception:
-                            pass
+                        onclick = attrs.get("onclick") or ""
+                        if onclick and "http" in onclick:
+                            urls = re.findall(r'https?://[^\s\'"]+', onclick)
+                            if urls:
+                                link = urls[0]
+                                print(f"  [selenium-debug] Method 5 (onclick) found: {link[:80]}")
                     
                     # Method 6: Try to find job ID and construct URL
                     if not link:
-                        try:
-                            # Look for job ID in various attributes
-                            job_id = None
-                            for attr in ['id', 'data-id', 'data-job-id', 'data-jobid', 'aria-label', 'data-job-requisition-id']:
-                                val = elem.get_attribute(attr) or ""
-                                # Extract job ID (keep as string to avoid number truncation)
-                                import re
-                                # Match full alphanumeric ID (not just first digits)
-                                id_match = re.search(r'(\d{10,}[-\w]*)', val)  # Match 10+ digits, optionally followed by hyphens/words
-                                if id_match:
-                                    job_id = id_match.group(1)  # Keep full ID as string
-                                    print(f"  [selenium-debug] Extracted job ID: {job_id}")
-                                    break
-                            
-                            if job_id:
-                                # Try common URL patterns
-                                base_patterns = [
-                                    f"{absolute_base}/jobs/{job_id}",
-                                    f"{absolute_base}/job/{job_id}",
-                                    f"{absolute_base}/careers/{job_id}",
-                                    f"{absolute_base}/en-us/jobs/{job_id}",
-                                    f"{absolute_base}/about/careers/applications/jobs/results/{job_id}",  # Google specific
-                                ]
-                                for pattern in base_patterns:
-                                    link = pattern
-                                    print(f"  [selenium-debug] Method 6 (constructed from ID {job_id}) found: {link[:120]}")  # Show more chars
-                                    break
-                        except Exception as e:
-                            print(f"  [selenium-debug] Method 6 failed: {e}")
+                        # Look for job ID in various attributes
+                        job_id = None
+                        for attr in ['id', 'data-id', 'data-job-id', 'data-jobid', 'aria-label', 'data-job-requisition-id']:
+                            val = attrs.get(attr) or ""
+                            # Match full alphanumeric ID (not just first digits)
+                            id_match = re.search(r'(\d{10,}[-\w]*)', val)  # Match 10+ digits, optionally followed by hyphens/words
+                            if id_match:
+                                job_id = id_match.group(1)  # Keep full ID as string
+                                print(f"  [selenium-debug] Extracted job ID: {job_id}")
+                                break
+                        
+                        if job_id:
+                            # Try common URL patterns
+                            link = f"{absolute_base}/jobs/{job_id}"
+                            print(f"  [selenium-debug] Method 6 (constructed from ID {job_id}) found: {link[:120]}")  # Show more chars
                     
                     # Normalize relative links
                     if link and absolute_base and link.startswith('/'):
@@ -738,10 +759,11 @@ def fetch_selenium_sites(sites: list[Any], fetch_limit: int) -> list[dict[str, A
                     import traceback
                     print(f"[selenium-debug] Traceback: {traceback.format_exc()[:300]}")
     finally:
-        try:
-            driver.quit()
-        except Exception:
-            pass
+        if owns_driver:
+            try:
+                driver.quit()
+            except Exception:
+                pass
     return results
 
 
@@ -767,7 +789,7 @@ def fetch_selenium_site_parallel(site: dict[str, Any], fetch_limit: int) -> list
     
     try:
         # Use the existing fetch_selenium_sites logic for a single site
-        temp_results = fetch_selenium_sites([site], fetch_limit)
+        temp_results = fetch_selenium_sites([site], fetch_limit, driver=driver)
         results.extend(temp_results)
     except Exception as e:
         print(f"[selenium-parallel] Error fetching {site.get('company', 'unknown')}: {str(e)[:100]}")